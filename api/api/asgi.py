@@ -11,6 +11,10 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from otel_config import configure_telemetry
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "api.settings")
 
+configure_telemetry()
+
 application = get_asgi_application()
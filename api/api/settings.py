@@ -15,18 +15,8 @@ from pathlib import Path
 
 import dj_database_url
 
-from otel_config import configure_server_telemetry
-
-# Initialize OpenTelemetry
-configure_server_telemetry()
-
-# Initialize Redis instrumentation globally (for RQ workers)
-try:
-    from opentelemetry.instrumentation.redis import RedisInstrumentor
-
-    RedisInstrumentor().instrument()
-except ImportError:
-    pass  # Redis instrumentation not available
+# OpenTelemetry is configured by the entry points (wsgi.py, asgi.py, rq_worker and the
+# traced management commands), not here, so importing settings stays side-effect free.
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -96,7 +86,15 @@ WSGI_APPLICATION = "api.wsgi.application"
 if not os.environ.get("DATABASE_URL"):
     raise ValueError("DATABASE_URL environment variable is required in production")
 
-DATABASES = {"default": dj_database_url.parse(os.environ.get("DATABASE_URL"))}
+# Keep connections open across requests (re-checked before reuse) instead of reconnecting per request
+DATABASES = {
+    "default": dj_database_url.parse(
+        os.environ.get("DATABASE_URL"),
+        conn_max_age=int(os.environ.get("DATABASE_CONN_MAX_AGE", "600")),
+        conn_health_checks=True,
+    )
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -184,7 +182,35 @@ MAILPACE_API_KEY = os.environ.get("MAILPACE_API_KEY", "")
 MAILPACE_API_URL = "https://app.mailpace.com/api/v1/send"
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@yourdomain.com")
 
+# Cache Configuration
+# Share the cache across gunicorn workers via Redis when available; otherwise use Django's per-process default
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ.get("REDIS_URL"),
+            "KEY_PREFIX": "cache",
+        }
+    }
+
+# How long the page view endpoint caches site identifier -> id lookups. Deleting a site only clears the entry
+# from the cache it can reach, so with per-process caches other workers would keep accepting page views for a
+# deleted site (and fail on insert); without the shared Redis cache the lookups aren't cached at all.
+SITE_ID_CACHE_TIMEOUT = 15 * 60 if os.environ.get("REDIS_URL") else 0
+
+# Page View Writes
+# Buffer tracked page views in each process and insert them in batches instead of one INSERT per request.
+# Batches that fail because the database is unreachable are retried, but page views still buffered when a
+# process is killed are lost, and the oldest are dropped once too many are waiting, as are rows the database
+# rejects (see server/pageview_buffer.py).
+PAGEVIEW_WRITE_BUFFER = os.environ.get("PAGEVIEW_WRITE_BUFFER", "false").lower() == "true"
+
 # Session Configuration
+# With the shared Redis cache, serve session lookups from it and only fall back to the database on a miss.
+# A per-process cache would keep serving a session to other workers after it's logged out or flushed, so
+# without Redis sessions stay in the database only (Django's default engine).
+if os.environ.get("REDIS_URL"):
+    SESSION_ENGINE = "django.contrib.sessions.backends.cached_db"
 SESSION_COOKIE_AGE = 86400 * 30  # 30 days
 SESSION_COOKIE_SECURE = False  # Set to True in production with HTTPS
 SESSION_COOKIE_HTTPONLY = True
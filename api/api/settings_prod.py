@@ -31,7 +31,14 @@ MIDDLEWARE = [
 if not os.environ.get("DATABASE_URL"):
     raise ValueError("DATABASE_URL environment variable is required in production")
 
-DATABASES = {"default": dj_database_url.parse(os.environ.get("DATABASE_URL"))}
+# Keep connections open between requests instead of reconnecting each time
+DATABASES = {
+    "default": dj_database_url.parse(
+        os.environ.get("DATABASE_URL"),
+        conn_max_age=int(os.environ.get("DATABASE_CONN_MAX_AGE", "600")),
+        conn_health_checks=True,
+    )
+}
 
 # Static files configuration for production
 STATIC_ROOT = "/app/staticfiles"
@@ -55,9 +62,10 @@ LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
+        # No asctime: the container runtime already timestamps each log line
         "verbose": {
-            "format": "{levelname} {asctime} {module} {process:d} {thread:d} {message}",
-            "style": "{",
+            "format": "%(levelname)s %(module)s %(process)d %(thread)d %(message)s",
+            "style": "%",
         },
     },
     "handlers": {
@@ -73,7 +81,7 @@ LOGGING = {
     "loggers": {
         "django": {
             "handlers": ["console"],
-            "level": "INFO",
+            "level": "WARNING",
             "propagate": False,
         },
     },
@@ -3,16 +3,32 @@ OpenTelemetry configuration for Django app and queue workers.
 """
 
 import os
+import threading
 
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import SERVICE_NAME, Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
 
 # Global flag to prevent multiple configurations
 _telemetry_configured = False
 
+# Guards one-time setup against concurrent callers
+_telemetry_lock = threading.Lock()
+
+
+def _build_export_session():
+    """
+    Build a pooled keep-alive HTTP session for the span exporter.
+
+    Reusing connections avoids a fresh TCP + TLS handshake for every exported batch.
+    Retries are left to the exporter itself.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=0))
+    session.headers["Connection"] = "keep-alive"
+    return session
+
 
 def configure_opentelemetry(service_name: str, dataset_name: str):
     """
@@ -28,11 +44,66 @@ def configure_opentelemetry(service_name: str, dataset_name: str):
     if _telemetry_configured:
         return trace.get_tracer(service_name)
 
-    # Define the service name resource
-    resource = Resource(attributes={SERVICE_NAME: service_name})
+    with _telemetry_lock:
+        # Re-check: another thread may have finished configuring while we waited
+        if not _telemetry_configured:
+            _install_tracer_provider(service_name, dataset_name)
+            # Mark as configured to prevent duplicate setups
+            _telemetry_configured = True
+
+    # Return a tracer for external use
+    return trace.get_tracer(service_name)
+
+
+def _build_request_sampler(ratio: float):
+    """
+    Build a root sampler that samples HTTP server spans at the given ratio and keeps all other root spans.
+
+    Management commands, RQ jobs and the queue health check report their results as attributes on
+    their root span, so sampling those would drop the data itself rather than trim request volume.
+
+    Args:
+        ratio: Fraction of request traces to keep (0.0 - 1.0)
+    """
+    from opentelemetry.sdk.trace.sampling import ALWAYS_ON, Sampler, TraceIdRatioBased
+
+    request_sampler = TraceIdRatioBased(ratio)
+
+    class RequestRatioSampler(Sampler):
+        def should_sample(
+            self, parent_context, trace_id, name, kind=None, attributes=None, links=None, trace_state=None
+        ):
+            sampler = request_sampler if kind == trace.SpanKind.SERVER else ALWAYS_ON
+            return sampler.should_sample(parent_context, trace_id, name, kind, attributes, links, trace_state)
+
+        def get_description(self):
+            return f"RequestRatioSampler{{{ratio}}}"
+
+    return RequestRatioSampler()
+
+
+def _install_tracer_provider(service_name: str, dataset_name: str):
+    """Build the TracerProvider with the Axiom exporter and install it globally."""
+    # Import the SDK lazily so processes that never configure tracing skip its import cost
+    from opentelemetry.exporter.otlp.proto.http import Compression
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased
+
+    # Define the service name resource, merged with SDK defaults and OTEL_RESOURCE_ATTRIBUTES
+    resource = Resource.create({SERVICE_NAME: service_name})
+
+    # Sample a ratio of request traces and keep every other root trace (children follow their parent's decision).
+    # Setting OTEL_TRACES_SAMPLER hands sampler selection back to the SDK's env handling.
+    if os.getenv("OTEL_TRACES_SAMPLER"):
+        sampler = None
+    else:
+        sampler = ParentBased(root=_build_request_sampler(float(os.getenv("OTEL_TRACES_SAMPLER_ARG", "0.1"))))
 
     # Create a TracerProvider with the defined resource
-    provider = TracerProvider(resource=resource)
+    provider = TracerProvider(resource=resource, sampler=sampler)
 
     # Get Axiom configuration from environment variables
     axiom_api_token = os.getenv("AXIOM_API_TOKEN")
@@ -50,41 +121,52 @@ def configure_opentelemetry(service_name: str, dataset_name: str):
             "Authorization": f"Bearer {axiom_api_token}",
             "X-Axiom-Dataset": dataset_name,
         },
+        session=_build_export_session(),
+        # Span batches compress well; gzip unless OTEL_EXPORTER_OTLP_COMPRESSION says otherwise
+        compression=Compression(os.getenv("OTEL_EXPORTER_OTLP_COMPRESSION", "gzip")),
     )
 
     # Create a BatchSpanProcessor with the OTLP exporter
-    processor = BatchSpanProcessor(otlp_exporter)
+    # Larger queue absorbs request bursts, shorter delay/smaller batches keep exports quick.
+    # Each value can be tuned through the standard OTEL_BSP_* environment variables.
+    processor = BatchSpanProcessor(
+        otlp_exporter,
+        max_queue_size=int(os.getenv("OTEL_BSP_MAX_QUEUE_SIZE", "4096")),
+        schedule_delay_millis=int(os.getenv("OTEL_BSP_SCHEDULE_DELAY", "1000")),
+        max_export_batch_size=int(os.getenv("OTEL_BSP_MAX_EXPORT_BATCH_SIZE", "256")),
+        export_timeout_millis=int(os.getenv("OTEL_BSP_EXPORT_TIMEOUT", "10000")),
+    )
     provider.add_span_processor(processor)
 
     # Set the TracerProvider as the global tracer provider
     trace.set_tracer_provider(provider)
 
-    # Mark as configured to prevent duplicate setups
-    _telemetry_configured = True
+    # Trace Redis calls (RQ enqueues, cache hits) once the provider is in place
+    try:
+        from opentelemetry.instrumentation.redis import RedisInstrumentor
 
-    # Return a tracer for external use
-    return trace.get_tracer(service_name)
+        RedisInstrumentor().instrument()
+    except ImportError:
+        pass  # Redis instrumentation not available
 
 
 def configure_telemetry():
-    """Configure OpenTelemetry for the application."""
+    """
+    Configure OpenTelemetry for the application.
+
+    Called from the WSGI/ASGI entry points and from management commands that emit spans,
+    never at settings import, so migrate/shell/collectstatic don't need Axiom credentials
+    or start an exporter thread.
+    """
     dataset_name = os.getenv("AXIOM_DATASET", "server")
     return configure_opentelemetry("server", dataset_name)
 
 
-# Legacy alias for backward compatibility
-def configure_server_telemetry():
-    """Configure OpenTelemetry for the Django server."""
-    return configure_telemetry()
-
-
-# Global tracers for easy access
-server_tracer = None
-
-
 def get_tracer():
-    """Get or create the tracer."""
-    global server_tracer
-    if server_tracer is None:
-        server_tracer = configure_telemetry()
-    return server_tracer
+    """
+    Get the server tracer.
+
+    Safe to call at import time: until configure_telemetry() installs the provider this is
+    the API's proxy tracer, which records nothing and binds to the real provider once set.
+    """
+    return trace.get_tracer("server")
@@ -28,6 +28,12 @@ while true; do
     sleep 21600
 done &
 
+# Start session metrics updater (every minute)
+while true; do
+    python manage.py update_session_metrics
+    sleep 60
+done &
+
 # 📊 Start queue health monitor (every 30 seconds)
 echo "📊 Starting queue health monitor..."
 while true; do
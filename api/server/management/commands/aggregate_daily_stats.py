@@ -10,19 +10,27 @@ Usage:
 Options:
     --days=N: Process the last N days (default: 30)
     --site=identifier: Process only the specified site (default: all sites)
+    --workers=N: Number of sites to aggregate concurrently (default: 4)
 """
 
 import logging
-from datetime import UTC, datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, date, datetime, timedelta
+from functools import partial
 
 from django.core.management.base import BaseCommand
-from django.db import transaction
+from django.db import connection, transaction
+from django.db.models import Count, Max
+from django.db.models.functions import TruncDate
 from django.utils import timezone
 
-from otel_config import get_tracer
+from otel_config import configure_telemetry, get_tracer
 from server.models import DailyPageViewStats, PageView, Site
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer()
+
+ONE_DAY = timedelta(days=1)
 
 
 class Command(BaseCommand):
@@ -50,6 +58,12 @@ class Command(BaseCommand):
             type=str,
             help="Site identifier to process (default: all sites)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of sites to aggregate concurrently (default: 4)",
+        )
         parser.add_argument(
             "--verbose",
             action="store_true",
@@ -57,7 +71,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        tracer = get_tracer()
+        configure_telemetry()
         with tracer.start_as_current_span("aggregate_daily_stats_command") as span:
             days_to_process = options["days"]
             start_str = options.get("start")
@@ -106,37 +120,55 @@ class Command(BaseCommand):
                 end_date = timezone.now().date()
                 start_date = end_date - timedelta(days=days_to_process)
 
-            # Get sites to process
-            sites_query = Site.objects.all()
+            # Get sites to process (fetched once; only the columns the aggregation uses)
+            sites_query = Site.objects.only("id", "identifier")
             if site_identifier:
-                try:
-                    sites_query = sites_query.filter(identifier=site_identifier)
-                    if not sites_query.exists():
-                        self.stdout.write(self.style.ERROR(f"Site '{site_identifier}' not found"))
-                        return
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"Error filtering sites: {e}"))
-                    return
+                sites_query = sites_query.filter(identifier=site_identifier)
+            try:
+                sites = list(sites_query)
+            except Exception as e:
+                self.stdout.write(self.style.ERROR(f"Error filtering sites: {e}"))
+                return
+            if site_identifier and not sites:
+                self.stdout.write(self.style.ERROR(f"Site '{site_identifier}' not found"))
+                return
 
             total_processed = 0
             total_created = 0
             total_updated = 0
 
-            for site in sites_query:
-                try:
-                    created, updated, processed = self._process_site_days(site, start_date, end_date, verbose)
-                    total_created += created
-                    total_updated += updated
-                    total_processed += processed
-
-                    if verbose:
-                        self.stdout.write(
-                            f"Site {site.identifier}: {created} created, {updated} updated, {processed} pageviews processed"
-                        )
-
-                except Exception as e:
-                    self.stdout.write(self.style.ERROR(f"Error processing site {site.identifier}: {e}"))
-                    logger.exception(f"Error processing site {site.identifier}")
+            # Sites touch disjoint rows and the work is DB-bound, so aggregate them concurrently
+            # The day buckets and query bounds are the same for every site, so build them once up front
+            days = []
+            current_date = start_date
+            while current_date <= end_date:
+                days.append(current_date)
+                current_date += ONE_DAY
+            range_start = datetime.combine(start_date, datetime.min.time(), tzinfo=UTC)
+            range_end = datetime.combine(end_date + ONE_DAY, datetime.min.time(), tzinfo=UTC)
+
+            aggregate = partial(
+                self._aggregate_site, days=days, range_start=range_start, range_end=range_end, verbose=verbose
+            )
+            workers = min(options["workers"], len(sites))
+            if workers > 1:
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = list(executor.map(partial(self._in_worker_thread, aggregate), sites))
+            else:
+                results = [aggregate(site) for site in sites]
+
+            for site, counts in zip(sites, results, strict=True):
+                if counts is None:
+                    continue
+                created, updated, processed = counts
+                total_created += created
+                total_updated += updated
+                total_processed += processed
+
+                if verbose:
+                    self.stdout.write(
+                        f"Site {site.identifier}: {created} created, {updated} updated, {processed} pageviews processed"
+                    )
 
             # Set final span attributes
             span.set_attribute("command.total_created", total_created)
@@ -149,103 +181,145 @@ class Command(BaseCommand):
                 )
             )
 
-    def _process_site_days(self, site: Site, start_date, end_date, verbose: bool) -> tuple[int, int, int]:
+    def _aggregate_site(
+        self, site: Site, days: list[date], range_start: datetime, range_end: datetime, verbose: bool
+    ) -> tuple[int, int, int] | None:
+        """
+        Aggregate a single site in its own transaction so its buckets are created and updated together.
+
+        Errors are reported and swallowed so one failing site doesn't stop the others.
+
+        Returns:
+            tuple: (created_count, updated_count, processed_pageviews_count), or None if the site failed
+        """
+        try:
+            with transaction.atomic():
+                return self._process_site_days(site, days, range_start, range_end, verbose)
+        except Exception as e:
+            self.stdout.write(self.style.ERROR(f"Error processing site {site.identifier}: {e}"))
+            logger.exception(f"Error processing site {site.identifier}")
+            return None
+
+    def _in_worker_thread(self, func, *args):
+        """
+        Run func on a pool thread, closing the thread's own DB connection afterwards so none are leaked.
         """
-        Process daily aggregations for a single site within the date range.
+        try:
+            return func(*args)
+        finally:
+            connection.close()
+
+    def _process_site_days(
+        self, site: Site, days: list[date], range_start: datetime, range_end: datetime, verbose: bool
+    ) -> tuple[int, int, int]:
+        """
+        Process daily aggregations for a single site over the given day buckets.
+
+        range_start/range_end are the UTC datetime bounds of the buckets, precomputed by the caller.
 
         Returns:
             tuple: (created_count, updated_count, processed_pageviews_count)
         """
-        created_count = 0
         updated_count = 0
         processed_pageviews = 0
 
-        # Generate all day buckets in the range
-        current_date = start_date
+        # Create any missing daily stats records in one statement, then load the whole range at once
+        site_stats = DailyPageViewStats.objects.filter(
+            site=site,
+            day_bucket__gte=range_start.date(),
+            day_bucket__lt=range_end.date(),
+        )
+        existing_days = set(site_stats.values_list("day_bucket", flat=True))
+        DailyPageViewStats.objects.bulk_create(
+            [
+                DailyPageViewStats(site=site, day_bucket=day, pageview_count=0, unique_session_count=0)
+                for day in days
+                if day not in existing_days
+            ],
+            ignore_conflicts=True,
+        )
+        stats_by_day = {
+            stats.day_bucket: stats
+            for stats in site_stats.only("day_bucket", "pageview_count", "last_processed_created_at")
+        }
+        created_count = len(days) - len(existing_days)
+
+        # Aggregate every day in the range with a single GROUP BY query
+        pageviews_query = PageView.objects.filter(site=site, created_at__gte=range_start, created_at__lt=range_end)
+        day_totals = (
+            pageviews_query.annotate(bucket=TruncDate("created_at", tzinfo=UTC))
+            .values("bucket")
+            .annotate(
+                pageview_count=Count("id"),
+                unique_session_count=Count("session", distinct=True),
+                last_created_at=Max("created_at"),
+            )
+            .order_by("bucket")
+        )
 
-        while current_date <= end_date:
-            next_date = current_date + timedelta(days=1)
+        now = timezone.now()
+        changed_stats = []
+        # Verbose lines are buffered and written once per site, which also keeps concurrent sites from interleaving
+        verbose_lines = []
+        for totals in day_totals:
+            current_date = totals["bucket"]
+            daily_stats = stats_by_day[current_date]
 
-            # Convert dates to datetime for querying PageView records
-            day_start = timezone.make_aware(datetime.combine(current_date, datetime.min.time()), UTC)
-            day_end = timezone.make_aware(datetime.combine(next_date, datetime.min.time()), UTC)
+            # Skip days with no pageviews newer than the last processed one
+            if (
+                daily_stats.last_processed_created_at
+                and totals["last_created_at"] <= daily_stats.last_processed_created_at
+            ):
+                continue
 
-            try:
-                with transaction.atomic():
-                    # Get or create the daily stats record
-                    daily_stats, created = DailyPageViewStats.objects.get_or_create(
-                        site=site,
-                        day_bucket=current_date,
-                        defaults={
-                            "pageview_count": 0,
-                            "unique_session_count": 0,
-                        },
-                    )
+            # Deleted page views can leave the stored count above the new total; that isn't negative progress
+            new_pageview_count = max(totals["pageview_count"] - daily_stats.pageview_count, 0)
 
-                    # Find pageviews in this day that haven't been processed yet
-                    pageviews_query = PageView.objects.filter(
-                        site=site,
-                        created_at__gte=day_start,
-                        created_at__lt=day_end,
-                    )
+            # Counts are recomputed over the whole day, so unique sessions are never double-counted
+            daily_stats.pageview_count = totals["pageview_count"]
+            daily_stats.unique_session_count = totals["unique_session_count"]
 
-                    # If this is an update, only process new pageviews
-                    if not created and daily_stats.last_processed_pageview_id:
-                        pageviews_query = pageviews_query.filter(
-                            created_at__gt=PageView.objects.get(id=daily_stats.last_processed_pageview_id).created_at
-                        )
-
-                    pageviews = list(pageviews_query.order_by("created_at"))
-
-                    if pageviews:
-                        # Count total pageviews
-                        new_pageview_count = len(pageviews)
-
-                        # Count unique sessions
-                        session_ids = set()
-                        for pv in pageviews:
-                            if pv.session:
-                                session_ids.add(pv.session.id)
-
-                        # Update the aggregation
-                        if created:
-                            daily_stats.pageview_count = new_pageview_count
-                            daily_stats.unique_session_count = len(session_ids)
-                        else:
-                            daily_stats.pageview_count += new_pageview_count
-                            # For unique sessions, we need to recalculate to avoid double-counting
-                            all_sessions = (
-                                PageView.objects.filter(
-                                    site=site,
-                                    created_at__gte=day_start,
-                                    created_at__lt=day_end,
-                                    session__isnull=False,
-                                )
-                                .values_list("session", flat=True)
-                                .distinct()
-                            )
-                            daily_stats.unique_session_count = len(list(all_sessions))
-
-                        # Track the last processed pageview
-                        daily_stats.last_processed_pageview_id = pageviews[-1].id
-                        daily_stats.save()
-
-                        processed_pageviews += new_pageview_count
-
-                        if verbose:
-                            self.stdout.write(
-                                f"  {current_date}: {new_pageview_count} pageviews, {len(session_ids)} sessions"
-                            )
-
-                    if created:
-                        created_count += 1
-                    elif pageviews:  # Only count as updated if we actually processed new data
-                        updated_count += 1
+            # Track the last processed pageview; its id is looked up for all changed days at once below
+            daily_stats.last_processed_created_at = totals["last_created_at"]
+            daily_stats.updated_at = now
+            changed_stats.append(daily_stats)
 
-            except Exception as e:
-                logger.exception(f"Error processing day {current_date} for site {site.identifier}")
-                self.stdout.write(self.style.ERROR(f"Error processing {current_date} for {site.identifier}: {e}"))
+            processed_pageviews += new_pageview_count
+
+            if verbose:
+                verbose_lines.append(
+                    f"  {current_date}: {new_pageview_count} pageviews, {totals['unique_session_count']} sessions"
+                )
+
+            # Only count as updated if we actually processed new data into an existing record
+            if current_date in existing_days:
+                updated_count += 1
+
+        # Look up the id of each changed day's last pageview by its timestamp, in one query for the whole range.
+        # Older rows have random uuid4 ids, so Max("id") in the GROUP BY wouldn't identify the last one.
+        if changed_stats:
+            last_ids = dict(
+                pageviews_query.filter(created_at__in=[stats.last_processed_created_at for stats in changed_stats])
+                .order_by()
+                .values_list("created_at", "id")
+            )
+            for stats in changed_stats:
+                stats.last_processed_pageview_id = last_ids.get(stats.last_processed_created_at)
+
+        # Write every changed day back in batched UPDATEs (bulk_update skips auto_now, hence updated_at above)
+        DailyPageViewStats.objects.bulk_update(
+            changed_stats,
+            [
+                "pageview_count",
+                "unique_session_count",
+                "last_processed_pageview_id",
+                "last_processed_created_at",
+                "updated_at",
+            ],
+            batch_size=500,
+        )
 
-            current_date = next_date
+        if verbose_lines:
+            self.stdout.write("\n".join(verbose_lines))
 
         return created_count, updated_count, processed_pageviews
@@ -7,25 +7,21 @@ metrics to Axiom for monitoring and alerting purposes.
 Run this periodically (every 30-60 seconds) to maintain real-time queue visibility.
 """
 
-import os
-
 from django.core.management.base import BaseCommand
 
-from otel_config import get_tracer
+from otel_config import configure_telemetry, get_tracer
+from server.rq_util import get_connection, get_queue
 
 try:
-    import redis  # type: ignore
-    from rq import Queue, Worker  # type: ignore
+    from rq import Worker  # type: ignore
     from rq.registry import DeferredJobRegistry, FailedJobRegistry, StartedJobRegistry  # type: ignore
-
-    REDIS_URL = os.getenv("REDIS_URL")
-    redis_conn = redis.from_url(REDIS_URL) if REDIS_URL else None
 except Exception:  # pragma: no cover
-    redis_conn = None
-    Queue = None
     Worker = None
 
 
+tracer = get_tracer()
+
+
 class Command(BaseCommand):
     help = "Monitor Redis queue health and send metrics to Axiom"
 
@@ -43,15 +39,16 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        configure_telemetry()
         queue_name = options["queue"]
         verbose = options["verbose"]
 
-        tracer = get_tracer()
         with tracer.start_as_current_span("queue_health_check") as span:
             span.set_attribute("queue.name", queue_name)
             span.set_attribute("monitor.type", "health_check")
 
-            if not redis_conn or not Queue:
+            redis_conn = get_connection()
+            if redis_conn is None:
                 span.set_attribute("queue.error", "redis_unavailable")
                 span.set_attribute("queue.status", "error")
                 self.stdout.write(self.style.ERROR("❌ Redis connection not available"))
@@ -59,34 +56,40 @@ class Command(BaseCommand):
 
             try:
                 # Get queue instance
-                q = Queue(queue_name, connection=redis_conn)
-
-                # Basic queue metrics
-                queue_length = len(q)
-                span.set_attribute("queue.length", queue_length)
+                q = get_queue(queue_name)
 
                 # Job registries for detailed metrics
                 failed_registry = FailedJobRegistry(queue=q)
                 started_registry = StartedJobRegistry(queue=q)
                 deferred_registry = DeferredJobRegistry(queue=q)
 
-                failed_count = len(failed_registry)
-                started_count = len(started_registry)
-                deferred_count = len(deferred_registry)
+                # Read the queue length and registry sizes in a single round-trip. Raw ZCARDs skip the
+                # registry cleanup len() would do; the workers' maintenance task prunes expired entries.
+                pipe = redis_conn.pipeline(transaction=False)
+                pipe.llen(q.key)
+                pipe.zcard(failed_registry.key)
+                pipe.zcard(started_registry.key)
+                pipe.zcard(deferred_registry.key)
+                queue_length, failed_count, started_count, deferred_count = pipe.execute()
 
+                span.set_attribute("queue.length", queue_length)
                 span.set_attribute("queue.failed_jobs", failed_count)
                 span.set_attribute("queue.started_jobs", started_count)
                 span.set_attribute("queue.deferred_jobs", deferred_count)
                 span.set_attribute("queue.total_jobs", queue_length + started_count + deferred_count)
 
-                # Worker metrics
-                workers = Worker.all(connection=redis_conn)
-                active_workers = [w for w in workers if w.state == "busy"]
-                idle_workers = [w for w in workers if w.state == "idle"]
+                # Worker metrics: fetch every registered worker's state in one round-trip instead of
+                # loading each worker in full. Keys with no hash belong to dead workers not yet cleaned up.
+                pipe = redis_conn.pipeline(transaction=False)
+                for worker_key in Worker.all_keys(connection=redis_conn):
+                    pipe.hget(worker_key, "state")
+                worker_states = [state.decode() for state in pipe.execute() if state is not None]
+                worker_count = len(worker_states)
+                active_count = worker_states.count("busy")
 
-                span.set_attribute("workers.total", len(workers))
-                span.set_attribute("workers.active", len(active_workers))
-                span.set_attribute("workers.idle", len(idle_workers))
+                span.set_attribute("workers.total", worker_count)
+                span.set_attribute("workers.active", active_count)
+                span.set_attribute("workers.idle", worker_states.count("idle"))
 
                 # Health status determination
                 if queue_length > 100:
@@ -102,7 +105,7 @@ class Command(BaseCommand):
                 elif failed_count > 10:
                     status = "degraded"
                     span.set_attribute("queue.warning", "high_failure_rate")
-                elif len(workers) == 0:
+                elif worker_count == 0:
                     status = "no_workers"
                     span.set_attribute("alert.type", "no_workers")
                     span.set_attribute("alert.severity", "critical")
@@ -129,7 +132,7 @@ class Command(BaseCommand):
                         self.stdout.write(
                             self.style.SUCCESS(
                                 f"✅ Queue healthy: {queue_length} pending, "
-                                f"{len(active_workers)}/{len(workers)} workers active"
+                                f"{active_count}/{worker_count} workers active"
                             )
                         )
 
@@ -140,8 +143,8 @@ class Command(BaseCommand):
                     self.stdout.write(f"   • Started jobs: {started_count}")
                     self.stdout.write(f"   • Failed jobs: {failed_count}")
                     self.stdout.write(f"   • Deferred jobs: {deferred_count}")
-                    self.stdout.write(f"   • Total workers: {len(workers)}")
-                    self.stdout.write(f"   • Active workers: {len(active_workers)}")
+                    self.stdout.write(f"   • Total workers: {worker_count}")
+                    self.stdout.write(f"   • Active workers: {active_count}")
                     self.stdout.write(f"   • Status: {status}")
 
             except Exception as e:
@@ -9,55 +9,19 @@ Usage:
     python manage.py queue_backfill_missing_days [--days=N]
 """
 
-import os
+from collections import defaultdict
 from datetime import timedelta
 
-from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from otel_config import get_tracer
+from otel_config import configure_telemetry, get_tracer
 from server.models import DailyPageViewStats, Site
+from server.rq_util import enqueue_or_run_aggregation
 
-try:
-    import redis  # type: ignore
-    from rq import Queue  # type: ignore
-
-    REDIS_URL = os.getenv("REDIS_URL")
-    redis_conn = redis.from_url(REDIS_URL) if REDIS_URL else None
-except Exception:  # pragma: no cover
-    redis_conn = None
-    Queue = None  # type: ignore
-
-
-def _enqueue_or_run(site_identifier: str, start_date, end_date):
-    """Enqueue or directly run daily aggregation based on RQ availability."""
-    tracer = get_tracer()
-    with tracer.start_as_current_span("enqueue_backfill_daily_aggregation") as span:
-        span.set_attribute("site.identifier", site_identifier)
-        span.set_attribute("aggregation.start", start_date.isoformat())
-        span.set_attribute("aggregation.end", end_date.isoformat())
-        span.set_attribute("aggregation.days_count", (end_date - start_date).days + 1)
-
-        if redis_conn and Queue:
-            span.set_attribute("execution.mode", "enqueued")
-            q = Queue("aggregations", connection=redis_conn)
-            # Enqueue manage.py command through RQ (simple approach: call command in worker)
-            q.enqueue(
-                call_command,
-                "aggregate_daily_stats",
-                "--site",
-                site_identifier,
-                "--start",
-                start_date.isoformat(),
-                "--end",
-                end_date.isoformat(),
-            )
-        else:
-            span.set_attribute("execution.mode", "direct")
-            call_command(
-                "aggregate_daily_stats", site=site_identifier, start=start_date.isoformat(), end=end_date.isoformat()
-            )
+tracer = get_tracer()
+
+ONE_DAY = timedelta(days=1)
 
 
 class Command(BaseCommand):
@@ -72,7 +36,7 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
-        tracer = get_tracer()
+        configure_telemetry()
         with tracer.start_as_current_span("queue_backfill_missing_days_command") as span:
             days_to_check = options["days"]
             now = timezone.now()
@@ -83,30 +47,27 @@ class Command(BaseCommand):
             span.set_attribute("command.start_date", start_date.isoformat())
             span.set_attribute("command.end_date", end_date.isoformat())
 
-            sites = Site.objects.all()
-            site_count = sites.count()
-            span.set_attribute("command.sites_count", site_count)
+            # Only the id and identifier are used, so fetch them as tuples in a single query
+            sites = list(Site.objects.values_list("id", "identifier"))
+            span.set_attribute("command.sites_count", len(sites))
 
             total_queued = 0
+            pending_ranges = []
+
+            # Find existing daily stats for every site in the date range with one query
+            existing_days_by_site = defaultdict(set)
+            for site_id, day_bucket in DailyPageViewStats.objects.filter(
+                day_bucket__gte=start_date,
+                day_bucket__lte=end_date,
+            ).values_list("site_id", "day_bucket"):
+                existing_days_by_site[site_id].add(day_bucket)
 
-            for site in sites:
-                # Find existing daily stats for this site in the date range
-                existing_days = set(
-                    DailyPageViewStats.objects.filter(
-                        site=site,
-                        day_bucket__gte=start_date,
-                        day_bucket__lte=end_date,
-                    ).values_list("day_bucket", flat=True)
-                )
-
-                # Generate all days in the range and find missing ones
-                current_date = start_date
-                missing_days = []
-
-                while current_date <= end_date:
-                    if current_date not in existing_days:
-                        missing_days.append(current_date)
-                    current_date += timedelta(days=1)
+            # Every day in the range, built once and diffed against each site's existing days
+            all_days = [start_date + timedelta(days=i) for i in range(days_to_check + 1)]
+
+            for site_id, site_identifier in sites:
+                existing_days = existing_days_by_site[site_id]
+                missing_days = [day for day in all_days if day not in existing_days]
 
                 # Queue missing days for processing
                 if missing_days:
@@ -114,11 +75,14 @@ class Command(BaseCommand):
                     day_ranges = self._group_consecutive_days(missing_days)
 
                     for range_start, range_end in day_ranges:
-                        _enqueue_or_run(site.identifier, range_start, range_end)
+                        pending_ranges.append((site_identifier, range_start, range_end))
                         total_queued += (range_end - range_start).days + 1
 
-                    span.set_attribute(f"site.{site.identifier}.missing_days", len(missing_days))
-                    self.stdout.write(f"Site {site.identifier}: queued {len(missing_days)} missing days")
+                    span.set_attribute(f"site.{site_identifier}.missing_days", len(missing_days))
+                    self.stdout.write(f"Site {site_identifier}: queued {len(missing_days)} missing days")
+
+            if pending_ranges:
+                enqueue_or_run_aggregation("daily", pending_ranges)
 
             span.set_attribute("command.total_queued", total_queued)
 
@@ -143,7 +107,7 @@ class Command(BaseCommand):
         range_end = days[0]
 
         for i in range(1, len(days)):
-            if days[i] == range_end + timedelta(days=1):
+            if days[i] == range_end + ONE_DAY:
                 # Consecutive day, extend the range
                 range_end = days[i]
             else:
@@ -5,57 +5,26 @@ Run this hourly. Enqueues specific hour windows that have no aggregation record.
 Falls back to direct execution if RQ/Redis is not available.
 """
 
-import os
+from collections import defaultdict
 from datetime import timedelta
 
-from django.core.management import call_command
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 
-from otel_config import get_tracer
+from otel_config import configure_telemetry, get_tracer
 from server.models import HourlyPageViewStats, Site
+from server.rq_util import enqueue_or_run_aggregation
 
-try:
-    import redis  # type: ignore
-    from rq import Queue  # type: ignore
-
-    REDIS_URL = os.getenv("REDIS_URL")
-    redis_conn = redis.from_url(REDIS_URL) if REDIS_URL else None
-except Exception:  # pragma: no cover
-    redis_conn = None
-    Queue = None  # type: ignore
-
-
-def _enqueue_or_run(site_identifier: str, start, end):
-    tracer = get_tracer()
-    with tracer.start_as_current_span("enqueue_backfill_hourly_aggregation") as span:
-        span.set_attribute("site.identifier", site_identifier)
-        span.set_attribute("aggregation.start", start.isoformat())
-        span.set_attribute("aggregation.end", end.isoformat())
-
-        if redis_conn and Queue:
-            span.set_attribute("execution.mode", "enqueued")
-            q = Queue("aggregations", connection=redis_conn)
-            q.enqueue(
-                call_command,
-                "aggregate_hourly_stats",
-                "--site",
-                site_identifier,
-                "--start",
-                start.isoformat(),
-                "--end",
-                end.isoformat(),
-            )
-        else:
-            span.set_attribute("execution.mode", "direct")
-            call_command("aggregate_hourly_stats", site=site_identifier, start=start.isoformat(), end=end.isoformat())
+tracer = get_tracer()
+
+ONE_HOUR = timedelta(hours=1)
 
 
 class Command(BaseCommand):
     help = "Queue per-site backfill for missing hourly aggregations in the last 7 days (run hourly)"
 
     def handle(self, *args, **options):
-        tracer = get_tracer()
+        configure_telemetry()
         with tracer.start_as_current_span("queue_backfill_missing_hours_command") as span:
             now = timezone.now()
             start_window = (now - timedelta(days=7)).replace(minute=0, second=0, microsecond=0)
@@ -65,27 +34,76 @@ class Command(BaseCommand):
             span.set_attribute("command.end_window", end_window.isoformat())
             span.set_attribute("command.days_back", 7)
 
-            sites = Site.objects.all().only("id", "identifier")
-            site_count = sites.count()
-            span.set_attribute("command.sites_count", site_count)
+            # Only the id and identifier are used, so fetch them as tuples in a single query
+            sites = list(Site.objects.values_list("id", "identifier"))
+            span.set_attribute("command.sites_count", len(sites))
 
             total_missing_hours = 0
-
-            # Iterate per site; for each hour in window, check if aggregation exists, if not queue
-            for site in sites:
-                site_missing_hours = 0
-                current_hour = start_window
-                while current_hour < end_window:
-                    exists = HourlyPageViewStats.objects.filter(site=site, hour_bucket=current_hour).exists()
-                    if not exists:
-                        _enqueue_or_run(site.identifier, current_hour, current_hour + timedelta(hours=1))
-                        site_missing_hours += 1
-                        total_missing_hours += 1
-                    current_hour += timedelta(hours=1)
+            pending_ranges = []
+
+            # Every hour bucket in the window, built once and diffed against each site's existing buckets
+            window_hours = int((end_window - start_window) / ONE_HOUR)
+            expected_hours = [start_window + timedelta(hours=i) for i in range(window_hours)]
+
+            # Find the hours that already have an aggregation, for every site, with one query
+            existing_hours_by_site = defaultdict(set)
+            for site_id, hour_bucket in HourlyPageViewStats.objects.filter(
+                hour_bucket__gte=start_window,
+                hour_bucket__lt=end_window,
+            ).values_list("site_id", "hour_bucket"):
+                existing_hours_by_site[site_id].add(hour_bucket)
+
+            # Iterate per site and queue every hour without an aggregation
+            for site_id, site_identifier in sites:
+                existing_hours = existing_hours_by_site[site_id]
+                missing_hours = [hour for hour in expected_hours if hour not in existing_hours]
+                site_missing_hours = len(missing_hours)
+                total_missing_hours += site_missing_hours
+
+                # Group consecutive hours so an outage becomes one job instead of one per hour;
+                # the aggregation's --end hour is inclusive, like the daily backfill's end date
+                for range_start, range_end in self._group_consecutive_hours(missing_hours):
+                    pending_ranges.append((site_identifier, range_start, range_end))
 
                 if site_missing_hours > 0:
-                    span.set_attribute(f"site.{site.identifier}.missing_hours", site_missing_hours)
+                    span.set_attribute(f"site.{site_identifier}.missing_hours", site_missing_hours)
+
+            if pending_ranges:
+                enqueue_or_run_aggregation("hourly", pending_ranges)
 
             span.set_attribute("command.total_missing_hours", total_missing_hours)
 
             self.stdout.write(self.style.SUCCESS("Queued/processed backfill for missing hours (last 7 days)"))
+
+    def _group_consecutive_hours(self, hours):
+        """
+        Group consecutive hours into ranges for efficient batch processing.
+
+        Args:
+            hours: List of hour-aligned datetime objects
+
+        Returns:
+            List of (start_hour, end_hour) tuples
+        """
+        if not hours:
+            return []
+
+        hours = sorted(hours)
+        ranges = []
+        range_start = hours[0]
+        range_end = hours[0]
+
+        for i in range(1, len(hours)):
+            if hours[i] == range_end + ONE_HOUR:
+                # Consecutive hour, extend the range
+                range_end = hours[i]
+            else:
+                # Gap found, close current range and start new one
+                ranges.append((range_start, range_end))
+                range_start = hours[i]
+                range_end = hours[i]
+
+        # Add the final range
+        ranges.append((range_start, range_end))
+
+        return ranges
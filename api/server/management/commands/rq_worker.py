@@ -7,20 +7,16 @@ import sys
 
 from django.core.management.base import BaseCommand
 
-from otel_config import get_tracer
-
-# OpenTelemetry will be initialized by Django settings
-# Redis instrumentation should be done once globally
+from otel_config import configure_telemetry
+from server.rq_util import get_connection
 
 try:
     import redis
     from rq import Queue, Worker
-    from rq.job import Job
 except ImportError:
     redis = None
     Worker = None
     Queue = None
-    Job = None
 
 
 class Command(BaseCommand):
@@ -53,14 +49,14 @@ class Command(BaseCommand):
             )
             sys.exit(1)
 
+        # Jobs run in forked work horses, which inherit the provider installed here
+        configure_telemetry()
+
         try:
-            redis_conn = redis.from_url(redis_url)
+            # Pooled connection shared with any enqueueing done in this process
+            redis_conn = get_connection(redis_url)
             queue = Queue(queue_name, connection=redis_conn)
             worker = Worker([queue], connection=redis_conn)
-            tracer = get_tracer()
-            with tracer.start_as_current_span("rq_worker") as span:
-                span.set_attribute("queue", queue_name)
-                span.set_attribute("redis_url", redis_url)
 
             self.stdout.write(self.style.SUCCESS(f"Starting RQ worker for queue '{queue_name}' on {redis_url}"))
 
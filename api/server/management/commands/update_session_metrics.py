@@ -0,0 +1,65 @@
+"""
+Recalculates metrics for sessions that received page views recently.
+
+Session metrics are updated here in batches rather than on the page view request path.
+Run this every minute via cron or a scheduler.
+
+Usage:
+    python manage.py update_session_metrics [--minutes=N] [--batch-size=N]
+"""
+
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from otel_config import configure_telemetry, get_tracer
+from server.models import PageView, Session
+
+tracer = get_tracer()
+
+
+class Command(BaseCommand):
+    help = "Recalculate metrics for sessions with recent page views (run every minute)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=30,
+            help="Update sessions with page views from the last N minutes (default: 30)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of sessions recalculated per batch (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        configure_telemetry()
+        with tracer.start_as_current_span("update_session_metrics_command") as span:
+            since = timezone.now() - timedelta(minutes=options["minutes"])
+            batch_size = options["batch_size"]
+            span.set_attribute("command.since", since.isoformat())
+
+            # Sessions that gained a page view in the window
+            session_ids = (
+                PageView.objects.filter(created_at__gte=since, session__isnull=False)
+                .order_by()
+                .values_list("session_id", flat=True)
+                .distinct()
+            )
+
+            updated_count = 0
+            batch = []
+            for session_id in session_ids.iterator(chunk_size=batch_size):
+                batch.append(session_id)
+                if len(batch) == batch_size:
+                    updated_count += Session.bulk_update_metrics(batch, batch_size=batch_size)
+                    batch = []
+            if batch:
+                updated_count += Session.bulk_update_metrics(batch, batch_size=batch_size)
+
+            span.set_attribute("command.sessions_updated", updated_count)
+            self.stdout.write(self.style.SUCCESS(f"Updated metrics for {updated_count} sessions"))
@@ -2,9 +2,22 @@
 Middleware for handling Kamal-specific issues.
 """
 
+import json
 import re
 
-from django.http import JsonResponse
+from django.http import HttpResponse
+
+# Docker container IDs are 12 hex characters
+CONTAINER_ID_RE = re.compile(r"[a-f0-9]{12}")
+
+# The health check body never changes, so it is serialized once at import
+HEALTH_CHECK_BODY = json.dumps(
+    {
+        "status": "healthy",
+        "message": "Django REST Framework is configured and working!",
+        "version": "v1",
+    }
+).encode()
 
 
 class KamalHealthCheckMiddleware:
@@ -30,25 +43,17 @@ class KamalHealthCheckMiddleware:
 
     def _is_kamal_health_check(self, request):
         """Check if this is a Kamal health check request."""
-        # Must be a GET request to /up endpoint
-        if request.method != "GET" or request.path != "/up":
+        # Must be a GET request to /up endpoint; the path check rejects almost every request first
+        if request.path != "/up" or request.method != "GET":
             return False
 
         # Check if the host looks like a Docker container ID (12 hex chars)
         # Use META to avoid triggering ALLOWED_HOSTS validation
-        host = request.META.get("HTTP_HOST", "")
-        if ":" in host:
-            host = host.split(":")[0]  # Remove port
+        host = request.META.get("HTTP_HOST", "").partition(":")[0]  # Remove port
 
-        # Docker container IDs are 12 hex characters
-        return bool(re.match(r"^[a-f0-9]{12}$", host))
+        # fullmatch, unlike "$", doesn't accept a trailing newline
+        return CONTAINER_ID_RE.fullmatch(host) is not None
 
     def _handle_health_check(self):
         """Return a health check response."""
-        return JsonResponse(
-            {
-                "status": "healthy",
-                "message": "Django REST Framework is configured and working!",
-                "version": "v1",
-            }
-        )
+        return HttpResponse(HEALTH_CHECK_BODY, content_type="application/json")
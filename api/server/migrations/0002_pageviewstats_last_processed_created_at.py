@@ -0,0 +1,42 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_last_processed_created_at(apps, schema_editor):
+    PageView = apps.get_model("server", "PageView")
+    last_created_at = PageView.objects.filter(id=OuterRef("last_processed_pageview_id")).values("created_at")[:1]
+    for model_name in ("HourlyPageViewStats", "DailyPageViewStats"):
+        Stats = apps.get_model("server", model_name)
+        # One UPDATE per model; rows whose pageview no longer exists are left NULL
+        Stats.objects.filter(last_processed_pageview_id__isnull=False, last_processed_created_at__isnull=True).update(
+            last_processed_created_at=Subquery(last_created_at)
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="dailypageviewstats",
+            name="last_processed_created_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Creation time of the last pageview that was processed into this aggregation",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="hourlypageviewstats",
+            name="last_processed_created_at",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Creation time of the last pageview that was processed into this aggregation",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(backfill_last_processed_created_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0002_pageviewstats_last_processed_created_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="pageview",
+            index=models.Index(fields=["site", "created_at"], name="server_page_site_id_601e72_idx"),
+        ),
+    ]
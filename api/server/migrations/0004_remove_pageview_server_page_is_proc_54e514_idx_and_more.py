@@ -0,0 +1,27 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0003_pageview_server_page_site_id_601e72_idx"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="pageview",
+            name="server_page_is_proc_54e514_idx",
+        ),
+        migrations.AddIndex(
+            model_name="pageview",
+            index=models.Index(
+                condition=models.Q(("is_processed", False)),
+                fields=["created_at"],
+                name="pageview_unprocessed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="session",
+            index=models.Index(fields=["site", "created_at"], name="server_sess_site_id_02525d_idx"),
+        ),
+    ]
@@ -0,0 +1,34 @@
+import server.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0004_remove_pageview_server_page_is_proc_54e514_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pageview",
+            name="id",
+            field=models.UUIDField(
+                default=server.models.uuid7,
+                editable=False,
+                help_text="Unique identifier for the page view",
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="session",
+            name="id",
+            field=models.UUIDField(
+                default=server.models.uuid7,
+                editable=False,
+                help_text="Unique identifier for the session",
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
@@ -0,0 +1,59 @@
+from django.db import NotSupportedError, migrations, models
+
+# Existing values are 64-char SHA-256 hex strings; keep the first 16 bytes of each digest
+# rather than letting the default cast store the hex text as 64 bytes.
+FORWARD_SQL = (
+    'ALTER TABLE "server_pageview" ALTER COLUMN "ip_hash" TYPE bytea '
+    "USING decode(left(\"ip_hash\", 32), 'hex')"
+)
+REVERSE_SQL = (
+    'ALTER TABLE "server_pageview" ALTER COLUMN "ip_hash" TYPE varchar(64) '
+    "USING encode(\"ip_hash\", 'hex')"
+)
+
+
+def require_postgresql(schema_editor):
+    """Fail with a clear message instead of a syntax error on backends without decode()/encode()."""
+    vendor = schema_editor.connection.vendor
+    if vendor != "postgresql":
+        raise NotSupportedError(
+            f"Migration server.0006 converts ip_hash in place with PostgreSQL's decode(); {vendor} is not supported."
+        )
+
+
+def convert_ip_hashes(apps, schema_editor):
+    require_postgresql(schema_editor)
+    schema_editor.execute(FORWARD_SQL)
+
+
+def restore_ip_hashes(apps, schema_editor):
+    require_postgresql(schema_editor)
+    schema_editor.execute(REVERSE_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0005_alter_pageview_id_alter_session_id"),
+    ]
+
+    operations = [
+        # Rows converted by FORWARD_SQL hold truncated SHA-256, while rows written after this migration hold
+        # BLAKE2b-128, so the same IP hashes differently on either side of the deploy. Never compare
+        # ip_hash values across that boundary (e.g. to count unique visitors); only rows created after
+        # this migration ran are comparable with each other.
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(convert_ip_hashes, restore_ip_hashes),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="pageview",
+                    name="ip_hash",
+                    field=models.BinaryField(
+                        help_text="Hashed IP address for privacy (16-byte BLAKE2b digest)", max_length=16
+                    ),
+                ),
+            ],
+        ),
+    ]
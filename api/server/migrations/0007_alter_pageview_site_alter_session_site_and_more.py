@@ -0,0 +1,44 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0006_alter_pageview_ip_hash"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pageview",
+            name="site",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="The site this page view belongs to",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="page_views",
+                to="server.site",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="session",
+            name="site",
+            field=models.ForeignKey(
+                db_index=False,
+                help_text="The site this session belongs to",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="sessions",
+                to="server.site",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="pageview",
+            name="referrer",
+            field=models.TextField(blank=True, help_text="Referrer URL if available"),
+        ),
+        migrations.AlterField(
+            model_name="session",
+            name="referrer",
+            field=models.TextField(blank=True, help_text="Referrer URL for the session"),
+        ),
+    ]
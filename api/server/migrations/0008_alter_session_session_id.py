@@ -0,0 +1,59 @@
+from django.db import NotSupportedError, migrations, models
+
+# Existing values are 64-char hex digests; decode them in place. The varchar_pattern_ops index
+# Django adds for unique text columns can't be kept on bytea, so it's dropped first.
+FORWARD_SQL = [
+    'DROP INDEX IF EXISTS "server_session_session_id_ce97ec78_like"',
+    'ALTER TABLE "server_session" ALTER COLUMN "session_id" TYPE bytea USING decode("session_id", \'hex\')',
+]
+REVERSE_SQL = [
+    'ALTER TABLE "server_session" ALTER COLUMN "session_id" TYPE varchar(64) USING encode("session_id", \'hex\')',
+    'CREATE INDEX "server_session_session_id_ce97ec78_like" ON "server_session" ("session_id" varchar_pattern_ops)',
+]
+
+
+def require_postgresql(schema_editor):
+    """Fail with a clear message instead of a syntax error on backends without decode()/encode()."""
+    vendor = schema_editor.connection.vendor
+    if vendor != "postgresql":
+        raise NotSupportedError(
+            f"Migration server.0008 converts session_id in place with PostgreSQL's decode(); {vendor} is not supported."
+        )
+
+
+def convert_session_ids(apps, schema_editor):
+    require_postgresql(schema_editor)
+    for statement in FORWARD_SQL:
+        schema_editor.execute(statement)
+
+
+def restore_session_ids(apps, schema_editor):
+    require_postgresql(schema_editor)
+    for statement in REVERSE_SQL:
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0007_alter_pageview_site_alter_session_site_and_more"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(convert_session_ids, restore_session_ids),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="session",
+                    name="session_id",
+                    field=models.BinaryField(
+                        help_text="Anonymous session identifier (32-byte digest of IP + UA + time window)",
+                        max_length=32,
+                        unique=True,
+                    ),
+                ),
+            ],
+        ),
+    ]
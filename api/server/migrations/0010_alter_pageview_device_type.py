@@ -0,0 +1,62 @@
+from django.db import NotSupportedError, migrations, models
+
+# Map the stored names to their PageView.DeviceType values in place; blank or unexpected names become 0
+# (unknown), matching the old default.
+FORWARD_SQL = (
+    'ALTER TABLE "server_pageview" ALTER COLUMN "device_type" TYPE smallint USING '
+    "CASE \"device_type\" WHEN 'desktop' THEN 1 WHEN 'mobile' THEN 2 "
+    "WHEN 'tablet' THEN 3 WHEN 'bot' THEN 4 ELSE 0 END, "
+    'ADD CONSTRAINT "server_pageview_device_type_check" CHECK ("device_type" >= 0)'
+)
+REVERSE_SQL = (
+    'ALTER TABLE "server_pageview" DROP CONSTRAINT "server_pageview_device_type_check", '
+    'ALTER COLUMN "device_type" TYPE varchar(20) USING '
+    "CASE \"device_type\" WHEN 1 THEN 'desktop' WHEN 2 THEN 'mobile' "
+    "WHEN 3 THEN 'tablet' WHEN 4 THEN 'bot' ELSE 'unknown' END"
+)
+
+
+def require_postgresql(schema_editor):
+    """Fail with a clear message instead of a syntax error on backends without ALTER COLUMN ... USING."""
+    vendor = schema_editor.connection.vendor
+    if vendor != "postgresql":
+        raise NotSupportedError(
+            "Migration server.0010 converts device_type with PostgreSQL's ALTER COLUMN ... USING; "
+            f"{vendor} is not supported."
+        )
+
+
+def convert_device_types(apps, schema_editor):
+    require_postgresql(schema_editor)
+    schema_editor.execute(FORWARD_SQL)
+
+
+def restore_device_types(apps, schema_editor):
+    require_postgresql(schema_editor)
+    schema_editor.execute(REVERSE_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0009_alter_dailypageviewstats_created_at_and_more"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[
+                migrations.RunPython(convert_device_types, restore_device_types),
+            ],
+            state_operations=[
+                migrations.AlterField(
+                    model_name="pageview",
+                    name="device_type",
+                    field=models.PositiveSmallIntegerField(
+                        choices=[(0, "Unknown"), (1, "Desktop"), (2, "Mobile"), (3, "Tablet"), (4, "Bot")],
+                        default=0,
+                        help_text="Type of device",
+                    ),
+                ),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("server", "0010_alter_pageview_device_type"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="pageview",
+            name="session",
+            field=models.ForeignKey(
+                blank=True,
+                db_index=False,
+                help_text="The session this page view belongs to (assigned async)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="page_views",
+                to="server.session",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="pageview",
+            index=models.Index(fields=["session", "created_at"], name="server_page_session_9545af_idx"),
+        ),
+    ]
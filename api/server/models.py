@@ -1,12 +1,585 @@
 import hashlib
+import os
 import random
+import secrets
 import string
+import time
 import uuid
+from functools import lru_cache
 
 from django.contrib.auth.models import User
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models.functions import Extract, Floor, Now
+from django.db.models.lookups import Exact, GreaterThan
 from django.utils import timezone
 
+# How many generated identifiers a new site tries before giving up on unique-constraint collisions
+IDENTIFIER_MAX_ATTEMPTS = 5
+
+# Woodland-themed adjectives (200)
+IDENTIFIER_ADJECTIVES = (
+    # Original 30
+    "mossy",
+    "ancient",
+    "twisted",
+    "golden",
+    "silver",
+    "whispering",
+    "hidden",
+    "enchanted",
+    "misty",
+    "wild",
+    "verdant",
+    "shadowy",
+    "dappled",
+    "rustling",
+    "peaceful",
+    "mighty",
+    "gentle",
+    "dancing",
+    "singing",
+    "sleeping",
+    "dreaming",
+    "glowing",
+    "sparkling",
+    "silent",
+    "eternal",
+    "mystic",
+    "sacred",
+    "blessed",
+    "haunted",
+    "luminous",
+    # Nature descriptors
+    "dewy",
+    "fragrant",
+    "blooming",
+    "budding",
+    "sprouting",
+    "growing",
+    "flourishing",
+    "thriving",
+    "weathered",
+    "gnarled",
+    "knotted",
+    "hollow",
+    "fallen",
+    "standing",
+    "leaning",
+    "bending",
+    "swaying",
+    "trembling",
+    "shivering",
+    "quivering",
+    "still",
+    "moving",
+    "flowing",
+    "trickling",
+    "babbling",
+    "gurgling",
+    "splashing",
+    "dripping",
+    "soaking",
+    "damp",
+    # Colors and light
+    "amber",
+    "emerald",
+    "jade",
+    "copper",
+    "bronze",
+    "ivory",
+    "ebony",
+    "crimson",
+    "scarlet",
+    "violet",
+    "indigo",
+    "turquoise",
+    "azure",
+    "cerulean",
+    "ochre",
+    "umber",
+    "sienna",
+    "russet",
+    "tawny",
+    "dun",
+    "grey",
+    "ashen",
+    "smoky",
+    "dusky",
+    "twilight",
+    "dawn",
+    "dusk",
+    "moonlit",
+    "starlit",
+    "sunlit",
+    # Textures and qualities
+    "smooth",
+    "rough",
+    "soft",
+    "hard",
+    "fuzzy",
+    "prickly",
+    "thorny",
+    "silky",
+    "velvety",
+    "feathery",
+    "downy",
+    "fluffy",
+    "tangled",
+    "woven",
+    "matted",
+    "braided",
+    "coiled",
+    "spiraling",
+    "branching",
+    "forked",
+    "split",
+    "cracked",
+    "broken",
+    "whole",
+    "perfect",
+    "flawed",
+    "pure",
+    "mixed",
+    "blended",
+    "layered",
+    # Seasons and weather
+    "spring",
+    "summer",
+    "autumn",
+    "winter",
+    "seasonal",
+    "evergreen",
+    "deciduous",
+    "perennial",
+    "annual",
+    "frosty",
+    "frozen",
+    "thawing",
+    "melting",
+    "warming",
+    "cooling",
+    "windy",
+    "breezy",
+    "gusty",
+    "calm",
+    "stormy",
+    "rainy",
+    "sunny",
+    "cloudy",
+    "foggy",
+    "hazy",
+    "clear",
+    "bright",
+    "dim",
+    "dark",
+    "light",
+    # Mystical and emotional
+    "magical",
+    "mystical",
+    "ethereal",
+    "otherworldly",
+    "earthly",
+    "grounded",
+    "floating",
+    "drifting",
+    "wandering",
+    "roaming",
+    "exploring",
+    "discovering",
+    "knowing",
+    "wise",
+    "young",
+    "old",
+    "timeless",
+    "ageless",
+    "joyful",
+    "merry",
+    "cheerful",
+    "somber",
+    "solemn",
+    "playful",
+    "serious",
+    "mysterious",
+    "secretive",
+    "revealing",
+    "concealing",
+    "protecting",
+    # More nature qualities
+    "natural",
+    "untamed",
+    "cultivated",
+    "pruned",
+    "overgrown",
+    "undergrown",
+    "towering",
+    "miniature",
+    "giant",
+    "tiny",
+    "massive",
+    "delicate",
+    "sturdy",
+    "fragile",
+    "resilient",
+    "flexible",
+    "rigid",
+    "supple",
+    "dried",
+    "fresh",
+    "aged",
+    "new",
+    "renewed",
+    "reborn",
+    "dying",
+    "living",
+    "breathing",
+    "resting",
+    "waking",
+    "stirring",
+)
+
+# Woodland-themed nouns (200)
+IDENTIFIER_NOUNS = (
+    # Original 30
+    "oak",
+    "pine",
+    "birch",
+    "willow",
+    "maple",
+    "cedar",
+    "acorn",
+    "mushroom",
+    "fern",
+    "moss",
+    "brook",
+    "stream",
+    "clearing",
+    "hollow",
+    "grove",
+    "canopy",
+    "roots",
+    "branch",
+    "leaf",
+    "squirrel",
+    "deer",
+    "owl",
+    "fox",
+    "badger",
+    "rabbit",
+    "hedgehog",
+    "robin",
+    "wren",
+    "beetle",
+    "firefly",
+    # Trees
+    "elm",
+    "ash",
+    "beech",
+    "hickory",
+    "walnut",
+    "chestnut",
+    "sycamore",
+    "poplar",
+    "aspen",
+    "alder",
+    "hawthorn",
+    "rowan",
+    "yew",
+    "fir",
+    "spruce",
+    "hemlock",
+    "larch",
+    "cypress",
+    "redwood",
+    "sequoia",
+    "juniper",
+    "hazel",
+    "holly",
+    "laurel",
+    "magnolia",
+    "dogwood",
+    "cherry",
+    "apple",
+    "pear",
+    "plum",
+    # Forest features
+    "thicket",
+    "copse",
+    "wood",
+    "forest",
+    "jungle",
+    "rainforest",
+    "understory",
+    "overstory",
+    "floor",
+    "trail",
+    "path",
+    "road",
+    "bridge",
+    "crossing",
+    "ford",
+    "bank",
+    "shore",
+    "edge",
+    "border",
+    "boundary",
+    "heart",
+    "center",
+    "depths",
+    "heights",
+    "valley",
+    "hill",
+    "mountain",
+    "cliff",
+    "ravine",
+    "gulch",
+    # Water features
+    "river",
+    "creek",
+    "spring",
+    "waterfall",
+    "cascade",
+    "rapids",
+    "pool",
+    "pond",
+    "lake",
+    "marsh",
+    "swamp",
+    "bog",
+    "wetland",
+    "fen",
+    "mire",
+    "puddle",
+    "drop",
+    "mist",
+    "fog",
+    "dew",
+    "rain",
+    "snow",
+    "ice",
+    "frost",
+    # Plants and fungi
+    "vine",
+    "ivy",
+    "bramble",
+    "thorn",
+    "thistle",
+    "nettle",
+    "flower",
+    "blossom",
+    "bloom",
+    "petal",
+    "stem",
+    "stalk",
+    "grass",
+    "reed",
+    "rush",
+    "sedge",
+    "herb",
+    "shrub",
+    "bush",
+    "hedge",
+    "lichen",
+    "fungus",
+    "toadstool",
+    "truffle",
+    "spore",
+    "mycelium",
+    "bracket",
+    "puffball",
+    "morel",
+    "chanterelle",
+    # Animals
+    "bear",
+    "wolf",
+    "lynx",
+    "bobcat",
+    "cougar",
+    "moose",
+    "elk",
+    "caribou",
+    "boar",
+    "porcupine",
+    "beaver",
+    "otter",
+    "mink",
+    "weasel",
+    "ferret",
+    "stoat",
+    "marten",
+    "fisher",
+    "raccoon",
+    "opossum",
+    "skunk",
+    "chipmunk",
+    "vole",
+    "mouse",
+    "shrew",
+    "mole",
+    "bat",
+    "hawk",
+    "eagle",
+    "falcon",
+    # Birds
+    "raven",
+    "crow",
+    "jay",
+    "cardinal",
+    "finch",
+    "sparrow",
+    "warbler",
+    "thrush",
+    "blackbird",
+    "starling",
+    "swallow",
+    "swift",
+    "woodpecker",
+    "nuthatch",
+    "chickadee",
+    "titmouse",
+    "creeper",
+    "kingfisher",
+    "heron",
+    "crane",
+    "duck",
+    "goose",
+    "swan",
+    "grouse",
+    # Insects and small creatures
+    "butterfly",
+    "moth",
+    "dragonfly",
+    "damselfly",
+    "bee",
+    "wasp",
+    "ant",
+    "termite",
+    "spider",
+    "centipede",
+    "millipede",
+    "snail",
+    "slug",
+    "worm",
+    "caterpillar",
+    "chrysalis",
+    "cocoon",
+    "cricket",
+    "grasshopper",
+    "mantis",
+    "cicada",
+    "aphid",
+    "ladybug",
+    "weevil",
+    # Natural objects
+    "stone",
+    "rock",
+    "boulder",
+    "pebble",
+    "crystal",
+    "mineral",
+    "soil",
+    "earth",
+    "clay",
+    "sand",
+    "loam",
+    "humus",
+    "log",
+    "stump",
+    "snag",
+    "burl",
+    "knot",
+    "bark",
+    "sap",
+    "resin",
+    "amber",
+    "needle",
+    "cone",
+    "nut",
+    "seed",
+    "berry",
+    "fruit",
+    "twig",
+    "stick",
+    "splinter",
+)
+
+
+# Characters allowed in a URL scheme, and those stripped from the start of a URL (C0 controls and space),
+# as in urllib.parse
+URL_SCHEME_CHARS = frozenset(string.ascii_letters + string.digits + "+-.")
+URL_LEADING_STRIP_CHARS = "".join(map(chr, range(0x21)))
+
+
+def uuid7():
+    """
+    Generate a UUIDv7 (RFC 9562): a 48-bit Unix millisecond timestamp followed by random bits.
+
+    Later ids sort after earlier ones, so inserts append to the end of the primary key index
+    instead of landing on a random page like uuid4.
+    """
+    value = ((time.time_ns() // 1_000_000) << 80) | int.from_bytes(os.urandom(10))
+    # Set the version (7) and variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+def split_netloc_and_path(url):
+    """
+    Split a URL into its network location and path, matching urlsplit(url).netloc and .path.
+
+    Follows urlsplit's steps (strip, drop fragment and query, optional scheme, "//" authority) but
+    only slices out the two parts page views store, without building a SplitResult. Unlike
+    urlsplit it doesn't reject malformed bracketed IPv6 hosts.
+
+    Returns:
+        tuple: (netloc, path); netloc is "" for URLs without a "//" authority
+    """
+    url = url.lstrip(URL_LEADING_STRIP_CHARS)
+    if "\t" in url or "\r" in url or "\n" in url:
+        url = url.replace("\t", "").replace("\r", "").replace("\n", "")
+
+    # Cut the fragment and query first, so a URL inside them (e.g. ?next=https://...) isn't read as the host
+    url = url.partition("#")[0].partition("?")[0]
+
+    colon = url.find(":")
+    if colon > 0 and url[0].isascii() and url[0].isalpha() and all(c in URL_SCHEME_CHARS for c in url[:colon]):
+        url = url[colon + 1 :]
+
+    if url[:2] != "//":
+        return "", url
+    netloc_end = url.find("/", 2)
+    if netloc_end == -1:
+        return url[2:], ""
+    return url[2:netloc_end], url[netloc_end:]
+
+
+# A visitor's page views within a 30-minute window all hash the same (ip, user agent, bucket) triple,
+# so recent digests are kept per process; entries for past buckets age out of the LRU on their own
+@lru_cache(maxsize=8192)
+def session_digest(ip_address, user_agent, time_bucket):
+    """
+    Hash a visitor's IP address, user agent and time bucket into a session identifier.
+
+    The identifier is a raw 32-byte BLAKE2b digest, fed piece by piece so the combined string is
+    never built. It's an opaque bucketing key, not a security primitive, so FIPS-restricted OpenSSL
+    builds may serve it from any backend.
+
+    Returns:
+        bytes: 32-byte digest
+    """
+    digest = hashlib.blake2b(digest_size=32, usedforsecurity=False)
+    digest.update(ip_address.encode())
+    digest.update(b":")
+    digest.update(user_agent.encode())
+    digest.update(b":")
+    digest.update(time_bucket.encode())
+    return digest.digest()
+
+
+def site_id_cache_key(site_identifier):
+    """Cache key for the primary key of the site with the given identifier."""
+    return f"site_id:{site_identifier}"
+
 
 class Site(models.Model):
     """
@@ -31,7 +604,9 @@ class Site(models.Model):
         db_index=True,
         help_text="Unique woodland-themed identifier (e.g., mossy-acorn-123456)",
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    # created_at is set by the database; updated_at stays auto_now, so bulk_update() and update() callers
+    # must set and write it themselves
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -41,515 +616,116 @@ class Site(models.Model):
         return f"{self.name} ({self.identifier})"
 
     def save(self, *args, **kwargs):
-        if not self.identifier:
+        if self.identifier:
+            super().save(*args, **kwargs)
+            return
+
+        # Collisions are vanishingly rare, so insert optimistically and let the unique constraint
+        # catch one instead of checking for it up front on every save
+        for attempt in range(IDENTIFIER_MAX_ATTEMPTS):
             self.identifier = self.generate_identifier()
-        super().save(*args, **kwargs)
+            try:
+                with transaction.atomic():
+                    super().save(*args, **kwargs)
+                return
+            except IntegrityError:
+                collided = Site.objects.filter(identifier=self.identifier).exists()
+                if not collided or attempt == IDENTIFIER_MAX_ATTEMPTS - 1:
+                    raise
+
+    @staticmethod
+    def generate_identifier():
+        """
+        Generates a woodland-themed identifier for the site.
+        Format: adjective-noun-XXXXXX (e.g., mossy-acorn-8F2A09)
 
-    def generate_identifier(self):
+        Uniqueness is enforced by the database; save() retries with a new identifier on a collision.
         """
-        Generates a unique woodland-themed identifier for the site.
-        Format: adjective-noun-XXXXXX (e.g., mossy-acorn-8K2PN9)
+        # Pick random adjective and noun
+        adjective = random.choice(IDENTIFIER_ADJECTIVES)
+        noun = random.choice(IDENTIFIER_NOUNS)
+
+        # Generate 6-character hash of uppercase hex digits
+        hash_part = secrets.token_hex(3).upper()
+
+        # Combine into identifier
+        return f"{adjective}-{noun}-{hash_part}"
+
+    @staticmethod
+    def generate_identifiers(count):
         """
-        # Woodland-themed adjectives (200)
-        adjectives = [
-            # Original 30
-            "mossy",
-            "ancient",
-            "twisted",
-            "golden",
-            "silver",
-            "whispering",
-            "hidden",
-            "enchanted",
-            "misty",
-            "wild",
-            "verdant",
-            "shadowy",
-            "dappled",
-            "rustling",
-            "peaceful",
-            "mighty",
-            "gentle",
-            "dancing",
-            "singing",
-            "sleeping",
-            "dreaming",
-            "glowing",
-            "sparkling",
-            "silent",
-            "eternal",
-            "mystic",
-            "sacred",
-            "blessed",
-            "haunted",
-            "luminous",
-            # Nature descriptors
-            "dewy",
-            "fragrant",
-            "blooming",
-            "budding",
-            "sprouting",
-            "growing",
-            "flourishing",
-            "thriving",
-            "weathered",
-            "gnarled",
-            "knotted",
-            "hollow",
-            "fallen",
-            "standing",
-            "leaning",
-            "bending",
-            "swaying",
-            "trembling",
-            "shivering",
-            "quivering",
-            "still",
-            "moving",
-            "flowing",
-            "trickling",
-            "babbling",
-            "gurgling",
-            "splashing",
-            "dripping",
-            "soaking",
-            "damp",
-            # Colors and light
-            "amber",
-            "emerald",
-            "jade",
-            "copper",
-            "bronze",
-            "ivory",
-            "ebony",
-            "crimson",
-            "scarlet",
-            "violet",
-            "indigo",
-            "turquoise",
-            "azure",
-            "cerulean",
-            "ochre",
-            "umber",
-            "sienna",
-            "russet",
-            "tawny",
-            "dun",
-            "grey",
-            "ashen",
-            "smoky",
-            "dusky",
-            "twilight",
-            "dawn",
-            "dusk",
-            "moonlit",
-            "starlit",
-            "sunlit",
-            # Textures and qualities
-            "smooth",
-            "rough",
-            "soft",
-            "hard",
-            "fuzzy",
-            "prickly",
-            "thorny",
-            "silky",
-            "velvety",
-            "feathery",
-            "downy",
-            "fluffy",
-            "tangled",
-            "woven",
-            "matted",
-            "braided",
-            "coiled",
-            "spiraling",
-            "branching",
-            "forked",
-            "split",
-            "cracked",
-            "broken",
-            "whole",
-            "perfect",
-            "flawed",
-            "pure",
-            "mixed",
-            "blended",
-            "layered",
-            # Seasons and weather
-            "spring",
-            "summer",
-            "autumn",
-            "winter",
-            "seasonal",
-            "evergreen",
-            "deciduous",
-            "perennial",
-            "annual",
-            "frosty",
-            "frozen",
-            "thawing",
-            "melting",
-            "warming",
-            "cooling",
-            "windy",
-            "breezy",
-            "gusty",
-            "calm",
-            "stormy",
-            "rainy",
-            "sunny",
-            "cloudy",
-            "foggy",
-            "hazy",
-            "clear",
-            "bright",
-            "dim",
-            "dark",
-            "light",
-            # Mystical and emotional
-            "magical",
-            "mystical",
-            "ethereal",
-            "otherworldly",
-            "earthly",
-            "grounded",
-            "floating",
-            "drifting",
-            "wandering",
-            "roaming",
-            "exploring",
-            "discovering",
-            "knowing",
-            "wise",
-            "young",
-            "old",
-            "timeless",
-            "ageless",
-            "joyful",
-            "merry",
-            "cheerful",
-            "somber",
-            "solemn",
-            "playful",
-            "serious",
-            "mysterious",
-            "secretive",
-            "revealing",
-            "concealing",
-            "protecting",
-            # More nature qualities
-            "natural",
-            "untamed",
-            "cultivated",
-            "pruned",
-            "overgrown",
-            "undergrown",
-            "towering",
-            "miniature",
-            "giant",
-            "tiny",
-            "massive",
-            "delicate",
-            "sturdy",
-            "fragile",
-            "resilient",
-            "flexible",
-            "rigid",
-            "supple",
-            "dried",
-            "fresh",
-            "aged",
-            "new",
-            "renewed",
-            "reborn",
-            "dying",
-            "living",
-            "breathing",
-            "resting",
-            "waking",
-            "stirring",
-        ]
+        Generate count identifiers in the same format as generate_identifier(), for bulk paths.
 
-        # Woodland-themed nouns (200)
-        nouns = [
-            # Original 30
-            "oak",
-            "pine",
-            "birch",
-            "willow",
-            "maple",
-            "cedar",
-            "acorn",
-            "mushroom",
-            "fern",
-            "moss",
-            "brook",
-            "stream",
-            "clearing",
-            "hollow",
-            "grove",
-            "canopy",
-            "roots",
-            "branch",
-            "leaf",
-            "squirrel",
-            "deer",
-            "owl",
-            "fox",
-            "badger",
-            "rabbit",
-            "hedgehog",
-            "robin",
-            "wren",
-            "beetle",
-            "firefly",
-            # Trees
-            "elm",
-            "ash",
-            "beech",
-            "hickory",
-            "walnut",
-            "chestnut",
-            "sycamore",
-            "poplar",
-            "aspen",
-            "alder",
-            "hawthorn",
-            "rowan",
-            "yew",
-            "fir",
-            "spruce",
-            "hemlock",
-            "larch",
-            "cypress",
-            "redwood",
-            "sequoia",
-            "juniper",
-            "hazel",
-            "holly",
-            "laurel",
-            "magnolia",
-            "dogwood",
-            "cherry",
-            "apple",
-            "pear",
-            "plum",
-            # Forest features
-            "thicket",
-            "copse",
-            "wood",
-            "forest",
-            "jungle",
-            "rainforest",
-            "understory",
-            "overstory",
-            "floor",
-            "trail",
-            "path",
-            "road",
-            "bridge",
-            "crossing",
-            "ford",
-            "bank",
-            "shore",
-            "edge",
-            "border",
-            "boundary",
-            "heart",
-            "center",
-            "depths",
-            "heights",
-            "valley",
-            "hill",
-            "mountain",
-            "cliff",
-            "ravine",
-            "gulch",
-            # Water features
-            "river",
-            "creek",
-            "spring",
-            "waterfall",
-            "cascade",
-            "rapids",
-            "pool",
-            "pond",
-            "lake",
-            "marsh",
-            "swamp",
-            "bog",
-            "wetland",
-            "fen",
-            "mire",
-            "puddle",
-            "drop",
-            "mist",
-            "fog",
-            "dew",
-            "rain",
-            "snow",
-            "ice",
-            "frost",
-            # Plants and fungi
-            "vine",
-            "ivy",
-            "bramble",
-            "thorn",
-            "thistle",
-            "nettle",
-            "flower",
-            "blossom",
-            "bloom",
-            "petal",
-            "stem",
-            "stalk",
-            "grass",
-            "reed",
-            "rush",
-            "sedge",
-            "herb",
-            "shrub",
-            "bush",
-            "hedge",
-            "lichen",
-            "fungus",
-            "toadstool",
-            "truffle",
-            "spore",
-            "mycelium",
-            "bracket",
-            "puffball",
-            "morel",
-            "chanterelle",
-            # Animals
-            "bear",
-            "wolf",
-            "lynx",
-            "bobcat",
-            "cougar",
-            "moose",
-            "elk",
-            "caribou",
-            "boar",
-            "porcupine",
-            "beaver",
-            "otter",
-            "mink",
-            "weasel",
-            "ferret",
-            "stoat",
-            "marten",
-            "fisher",
-            "raccoon",
-            "opossum",
-            "skunk",
-            "chipmunk",
-            "vole",
-            "mouse",
-            "shrew",
-            "mole",
-            "bat",
-            "hawk",
-            "eagle",
-            "falcon",
-            # Birds
-            "raven",
-            "crow",
-            "jay",
-            "cardinal",
-            "finch",
-            "sparrow",
-            "warbler",
-            "thrush",
-            "blackbird",
-            "starling",
-            "swallow",
-            "swift",
-            "woodpecker",
-            "nuthatch",
-            "chickadee",
-            "titmouse",
-            "creeper",
-            "kingfisher",
-            "heron",
-            "crane",
-            "duck",
-            "goose",
-            "swan",
-            "grouse",
-            # Insects and small creatures
-            "butterfly",
-            "moth",
-            "dragonfly",
-            "damselfly",
-            "bee",
-            "wasp",
-            "ant",
-            "termite",
-            "spider",
-            "centipede",
-            "millipede",
-            "snail",
-            "slug",
-            "worm",
-            "caterpillar",
-            "chrysalis",
-            "cocoon",
-            "cricket",
-            "grasshopper",
-            "mantis",
-            "cicada",
-            "aphid",
-            "ladybug",
-            "weevil",
-            # Natural objects
-            "stone",
-            "rock",
-            "boulder",
-            "pebble",
-            "crystal",
-            "mineral",
-            "soil",
-            "earth",
-            "clay",
-            "sand",
-            "loam",
-            "humus",
-            "log",
-            "stump",
-            "snag",
-            "burl",
-            "knot",
-            "bark",
-            "sap",
-            "resin",
-            "amber",
-            "needle",
-            "cone",
-            "nut",
-            "seed",
-            "berry",
-            "fruit",
-            "twig",
-            "stick",
-            "splinter",
+        Words are sampled with one random.choices() call per list and every suffix is sliced out of a
+        single token_hex() call, instead of drawing them separately for each identifier.
+
+        Returns:
+            list: count identifiers (not checked for uniqueness)
+        """
+        adjectives = random.choices(IDENTIFIER_ADJECTIVES, k=count)
+        nouns = random.choices(IDENTIFIER_NOUNS, k=count)
+        hash_parts = secrets.token_hex(3 * count).upper()
+        return [
+            f"{adjective}-{noun}-{hash_parts[i * 6 : i * 6 + 6]}"
+            for i, (adjective, noun) in enumerate(zip(adjectives, nouns))
         ]
 
-        while True:
-            # Pick random adjective and noun
-            adjective = random.choice(adjectives)
-            noun = random.choice(nouns)
+    @classmethod
+    def bulk_generate_identifiers(cls, count):
+        """
+        Generate identifiers for creating many sites at once (seeding, admin tools).
 
-            # Generate 6-character hash with letters and numbers (uppercase)
-            hash_part = "".join(random.choices(string.ascii_uppercase + string.digits, k=6))
+        Candidates are generated locally and checked against existing sites with one
+        identifier__in query per round; only the rare collisions are regenerated.
 
-            # Combine into identifier
-            identifier = f"{adjective}-{noun}-{hash_part}"
+        Returns:
+            list: count identifiers, unique among themselves and against existing sites
+        """
+        identifiers = []
+        seen = set()
+        while len(identifiers) < count:
+            # Generate the missing candidates, unique among themselves and everything tried so far
+            candidates = []
+            while len(identifiers) + len(candidates) < count:
+                for identifier in cls.generate_identifiers(count - len(identifiers) - len(candidates)):
+                    if identifier not in seen:
+                        seen.add(identifier)
+                        candidates.append(identifier)
+
+            taken = set(cls.objects.filter(identifier__in=candidates).values_list("identifier", flat=True))
+            identifiers.extend(identifier for identifier in candidates if identifier not in taken)
+        return identifiers
 
-            # Check if this identifier already exists
-            if not Site.objects.filter(identifier=identifier).exists():
-                return identifier
+    @classmethod
+    def bulk_create_with_identifiers(cls, sites, batch_size=500):
+        """
+        Create many sites with batched INSERTs instead of one save() per site.
+
+        save() is not called, so sites without an identifier get one from bulk_generate_identifiers().
+        A site created concurrently with the same identifier makes the insert fail with IntegrityError.
+
+        Args:
+            sites: Unsaved Site objects
+            batch_size: Number of rows per INSERT
+
+        Returns:
+            list: The created Site objects
+        """
+        missing = [site for site in sites if not site.identifier]
+        for site, identifier in zip(missing, cls.bulk_generate_identifiers(len(missing))):
+            site.identifier = identifier
+        return cls.objects.bulk_create(sites, batch_size=batch_size)
+
+
+class SiteRelatedManager(models.Manager):
+    """
+    Manager that joins the related site into every query, so listing rows and
+    printing them (__str__ uses site.identifier) doesn't fetch each site separately.
+    values()/aggregate() queries are unaffected.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("site")
 
 
 class Session(models.Model):
@@ -560,7 +736,7 @@ class Session(models.Model):
 
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for the session",
     )
@@ -568,14 +744,14 @@ class Session(models.Model):
         Site,
         on_delete=models.CASCADE,
         related_name="sessions",
+        db_index=False,  # Covered by the (site, created_at) index
         help_text="The site this session belongs to",
     )
 
-    session_id = models.CharField(
-        max_length=64,
-        db_index=True,
+    session_id = models.BinaryField(
+        max_length=32,
         unique=True,
-        help_text="Anonymous session identifier (generated from IP + UA + time window)",
+        help_text="Anonymous session identifier (32-byte digest of IP + UA + time window)",
     )
 
     # Session metrics
@@ -584,20 +760,26 @@ class Session(models.Model):
     page_view_count = models.IntegerField(default=0, help_text="Number of page views in this session")
 
     # Referrer for the session (first page view)
-    referrer = models.URLField(max_length=2048, blank=True, help_text="Referrer URL for the session")
+    referrer = models.TextField(blank=True, help_text="Referrer URL for the session")
     referrer_domain = models.CharField(max_length=255, blank=True, help_text="Domain of the referrer")
 
     enter_page = models.CharField(max_length=1024, help_text="First page visited in this session")
     exit_page = models.CharField(max_length=1024, blank=True, help_text="Last page visited in this session")
 
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = SiteRelatedManager()
+
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Index for a site's sessions over a time range
+            models.Index(fields=["site", "created_at"]),
+        ]
 
     def __str__(self):
-        return f"{self.site.identifier} session: {self.session_id[:8]}..."
+        return f"{self.site.identifier} session: {self.session_id.hex()[:8]}..."
 
     @classmethod
     def generate_session_id(cls, ip_address, user_agent, timestamp=None):
@@ -613,36 +795,100 @@ class Session(models.Model):
         if timestamp is None:
             timestamp = timezone.now()
 
-        # Round timestamp to 30-minute windows
-        minutes = timestamp.minute
-        rounded_minutes = (minutes // 30) * 30
-        time_bucket = timestamp.replace(minute=rounded_minutes, second=0, microsecond=0)
+        # Round timestamp to 30-minute windows, formatted straight to the bucket's isoformat()
+        # (e.g. 2024-01-15T14:30:00+00:00) instead of building a rounded datetime first
+        rounded_minutes = (timestamp.minute // 30) * 30
+        time_bucket = f"{timestamp:%Y-%m-%dT%H}:{rounded_minutes:02d}:00{timestamp:%:z}"
 
-        # Create session identifier
-        session_string = f"{ip_address}:{user_agent}:{time_bucket.isoformat()}"
-        session_id = hashlib.sha256(session_string.encode()).hexdigest()
-
-        return session_id
+        return session_digest(str(ip_address), user_agent, time_bucket)
 
     def update_metrics(self):
         """
         Update session metrics based on page views.
-        Called after a new page view is added to recalculate session statistics.
+        For recalculating many sessions, use bulk_update_metrics() (run by the update_session_metrics command).
+
+        The metrics are computed and written by a single UPDATE with correlated subqueries; the
+        instance's fields aren't refreshed, so call refresh_from_db() to read the new values.
         """
-        page_views = self.page_views.order_by("created_at")
-        count = page_views.count()
+        page_views = PageView.objects.filter(session=models.OuterRef("pk")).order_by()
+        totals = page_views.values("session")
+        count = models.Subquery(totals.annotate(count=models.Count("id")).values("count"))
+        span = models.Subquery(
+            totals.annotate(span=models.Max("created_at") - models.Min("created_at")).values("span"),
+            output_field=models.DurationField(),
+        )
+        exit_page = models.Subquery(page_views.order_by("-created_at").values("path")[:1])
+
+        # Duration and exit page are only set once the session has more than one page view
+        Session.objects.filter(models.Exists(page_views), pk=self.pk).update(
+            page_view_count=count,
+            updated_at=Now(),
+            is_bounce=models.Case(models.When(Exact(count, 1), then=True), default=False),
+            duration=models.Case(
+                models.When(GreaterThan(count, 1), then=Floor(Extract(span, "epoch"))),
+                default=models.F("duration"),
+                output_field=models.IntegerField(),
+            ),
+            exit_page=models.Case(
+                models.When(GreaterThan(count, 1), then=exit_page),
+                default=models.F("exit_page"),
+            ),
+        )
 
-        if count > 0:
-            self.page_view_count = count
-            self.is_bounce = count == 1
+    @classmethod
+    def bulk_update_metrics(cls, session_ids, batch_size=500):
+        """
+        Recalculate metrics for many sessions at once, the same way update_metrics() does for one.
 
-            if count > 1:
-                first_view = page_views.first()
-                last_view = page_views.last()
-                self.duration = int((last_view.created_at - first_view.created_at).total_seconds())
-                self.exit_page = last_view.path
+        Uses one GROUP BY query for the counts and time spans, one DISTINCT ON query for the exit pages
+        and batched UPDATEs, instead of a few queries and a save() per session.
 
-            self.save()
+        Args:
+            session_ids: Ids of the sessions to update
+            batch_size: Number of rows per UPDATE
+
+        Returns:
+            int: Number of sessions updated
+        """
+        page_views = PageView.objects.filter(session_id__in=session_ids)
+        totals = (
+            page_views.values("session_id")
+            .annotate(
+                count=models.Count("id"),
+                first_created_at=models.Min("created_at"),
+                last_created_at=models.Max("created_at"),
+            )
+            .order_by()
+        )
+        exit_pages = dict(
+            page_views.order_by("session_id", "-created_at").distinct("session_id").values_list("session_id", "path")
+        )
+
+        # Duration and exit page only change once a session has more than one page view, so single-view
+        # sessions are written without them
+        now = timezone.now()
+        single_view_sessions = []
+        multi_view_sessions = []
+        for row in totals:
+            count = row["count"]
+            session = cls(id=row["session_id"], page_view_count=count, is_bounce=count == 1, updated_at=now)
+            if count > 1:
+                session.duration = int((row["last_created_at"] - row["first_created_at"]).total_seconds())
+                session.exit_page = exit_pages[row["session_id"]]
+                multi_view_sessions.append(session)
+            else:
+                single_view_sessions.append(session)
+
+        # bulk_update() skips auto_now, hence updated_at above
+        cls.objects.bulk_update(
+            single_view_sessions, ["page_view_count", "is_bounce", "updated_at"], batch_size=batch_size
+        )
+        cls.objects.bulk_update(
+            multi_view_sessions,
+            ["page_view_count", "is_bounce", "duration", "exit_page", "updated_at"],
+            batch_size=batch_size,
+        )
+        return len(single_view_sessions) + len(multi_view_sessions)
 
 
 class PageView(models.Model):
@@ -650,9 +896,18 @@ class PageView(models.Model):
     Represents a single page view event in the analytics system.
     """
 
+    class DeviceType(models.IntegerChoices):
+        """Device types, stored as small integers rather than their names."""
+
+        UNKNOWN = 0, "Unknown"
+        DESKTOP = 1, "Desktop"
+        MOBILE = 2, "Mobile"
+        TABLET = 3, "Tablet"
+        BOT = 4, "Bot"
+
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
         help_text="Unique identifier for the page view",
     )
@@ -660,6 +915,7 @@ class PageView(models.Model):
         Site,
         on_delete=models.CASCADE,
         related_name="page_views",
+        db_index=False,  # Covered by the (site, created_at) index
         help_text="The site this page view belongs to",
     )
 
@@ -669,6 +925,7 @@ class PageView(models.Model):
         null=True,
         blank=True,
         related_name="page_views",
+        db_index=False,  # Covered by the (session, created_at) index
         help_text="The session this page view belongs to (assigned async)",
     )
 
@@ -677,28 +934,21 @@ class PageView(models.Model):
     path = models.CharField(max_length=1024, help_text="Path portion of the URL")
 
     # Referrer information
-    referrer = models.URLField(max_length=2048, blank=True, help_text="Referrer URL if available")
+    referrer = models.TextField(blank=True, help_text="Referrer URL if available")
     referrer_domain = models.CharField(max_length=255, blank=True, help_text="Domain of the referrer")
 
     # User identification (for session assignment)
-    ip_hash = models.CharField(max_length=64, help_text="Hashed IP address for privacy")
+    # Rows predating migration 0006 hold truncated SHA-256 instead; don't compare hashes across the two
+    ip_hash = models.BinaryField(max_length=16, help_text="Hashed IP address for privacy (16-byte BLAKE2b digest)")
     user_agent = models.TextField(help_text="Full user agent string")
 
     # Device information (parsed from user agent)
     browser = models.CharField(max_length=50, blank=True, help_text="Browser name")
     browser_version = models.CharField(max_length=20, blank=True, help_text="Browser version")
     operating_system = models.CharField(max_length=50, blank=True, help_text="Operating system")
-    device_type = models.CharField(
-        max_length=20,
-        blank=True,
-        choices=[
-            ("desktop", "Desktop"),
-            ("mobile", "Mobile"),
-            ("tablet", "Tablet"),
-            ("bot", "Bot"),
-            ("unknown", "Unknown"),
-        ],
-        default="unknown",
+    device_type = models.PositiveSmallIntegerField(
+        choices=DeviceType.choices,
+        default=DeviceType.UNKNOWN,
         help_text="Type of device",
     )
 
@@ -714,32 +964,69 @@ class PageView(models.Model):
         help_text="Whether session assignment has been processed",
     )
 
-    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    created_at = models.DateTimeField(db_default=Now(), db_index=True, editable=False)
+
+    objects = SiteRelatedManager()
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            # Index for finding unprocessed page views
-            models.Index(fields=["is_processed", "created_at"]),
+            # Index for finding unprocessed page views; partial, so it only holds the small backlog
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_processed=False),
+                name="pageview_unprocessed_idx",
+            ),
+            # Index for the per-site date-range scans done by the aggregation commands
+            models.Index(fields=["site", "created_at"]),
+            # Index for a session's page views in time order (session metrics: count, first/last, exit page)
+            models.Index(fields=["session", "created_at"]),
         ]
 
     def __str__(self):
         return f"{self.site.identifier}: {self.path} at {self.created_at}"
 
     def save(self, *args, **kwargs):
-        from urllib.parse import urlparse
+        # Derived fields only need filling on insert; later saves (e.g. session assignment) skip parsing
+        if self._state.adding:
+            self.fill_derived_fields()
+        super().save(*args, **kwargs)
 
+    @property
+    def device_type_name(self):
+        """Lowercase name of the device type (e.g. "desktop"), as reported by parse_user_agent."""
+        return self.DeviceType(self.device_type).name.lower()
+
+    def fill_derived_fields(self):
+        """Fill path and referrer_domain from url and referrer when they aren't already set."""
         # Extract path from URL if not provided
         if self.url and not self.path:
-            parsed = urlparse(self.url)
-            self.path = parsed.path or "/"
+            self.path = split_netloc_and_path(self.url)[1] or "/"
 
         # Extract referrer domain if referrer is provided
         if self.referrer and not self.referrer_domain:
-            parsed = urlparse(self.referrer)
-            self.referrer_domain = parsed.netloc
+            self.referrer_domain = split_netloc_and_path(self.referrer)[0]
 
-        super().save(*args, **kwargs)
+    @classmethod
+    def bulk_ingest(cls, events, batch_size=500):
+        """
+        Insert many page views with batched INSERTs instead of one save() per row.
+
+        save() is not called, so derived fields are filled here the same way it would fill them.
+
+        Args:
+            events: Iterable of dicts of PageView field values
+            batch_size: Number of rows per INSERT
+
+        Returns:
+            list: The created PageView objects
+        """
+        page_views = []
+        for event in events:
+            page_view = cls(**event)
+            page_view.fill_derived_fields()
+            page_views.append(page_view)
+        return cls.objects.bulk_create(page_views, batch_size=batch_size)
 
 
 class HourlyPageViewStats(models.Model):
@@ -783,7 +1070,12 @@ class HourlyPageViewStats(models.Model):
         blank=True,
         help_text="ID of the last pageview that was processed into this aggregation",
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    last_processed_created_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Creation time of the last pageview that was processed into this aggregation",
+    )
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -840,7 +1132,12 @@ class DailyPageViewStats(models.Model):
         blank=True,
         help_text="ID of the last pageview that was processed into this aggregation",
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    last_processed_created_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Creation time of the last pageview that was processed into this aggregation",
+    )
+    created_at = models.DateTimeField(db_default=Now(), editable=False)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
@@ -0,0 +1,123 @@
+"""
+Per-process write buffer for tracked page views (enabled with the PAGEVIEW_WRITE_BUFFER setting).
+
+Page views are queued in memory and a background thread inserts them with PageView.bulk_ingest()
+every FLUSH_INTERVAL seconds, or as soon as FLUSH_SIZE are waiting. Whatever is still queued is
+written when the interpreter exits.
+
+If the database can't be reached, a failed batch is requeued and retried on the next flush. Page
+views are lost when the process is killed before they're written (including while retrying), when
+more than MAX_PENDING are waiting (the oldest are dropped), and when the database rejects a row
+(e.g. for a deleted site); dropped page views are logged.
+"""
+
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import DataError, IntegrityError, close_old_connections, transaction
+
+from .models import PageView
+
+logger = logging.getLogger(__name__)
+
+# Flush once this many page views are waiting
+FLUSH_SIZE = 500
+
+# Seconds between flushes when traffic is below FLUSH_SIZE
+FLUSH_INTERVAL = 0.25
+
+# Most page views kept waiting while the database is unreachable; beyond this the oldest are dropped
+MAX_PENDING = 20_000
+
+_lock = threading.Lock()
+_pending = []
+_flush_requested = threading.Event()
+_flusher = None
+
+
+def is_enabled():
+    """Whether page views should be buffered rather than inserted by the request."""
+    return settings.PAGEVIEW_WRITE_BUFFER
+
+
+def add(fields):
+    """
+    Queue a page view for the next batched insert, starting the flush thread on first use.
+
+    Args:
+        fields: Dict of PageView field values
+    """
+    global _flusher
+
+    with _lock:
+        _pending.append(fields)
+        queued = len(_pending)
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_forever, name="pageview-buffer", daemon=True)
+            _flusher.start()
+            atexit.register(flush)
+
+    if queued >= FLUSH_SIZE:
+        _flush_requested.set()
+
+
+def flush():
+    """
+    Insert every queued page view.
+
+    Returns:
+        int: Number of page views written
+    """
+    global _pending
+
+    with _lock:
+        fields, _pending = _pending, []
+    if not fields:
+        return 0
+
+    try:
+        PageView.bulk_ingest(fields, batch_size=FLUSH_SIZE)
+    except (IntegrityError, DataError):
+        # A row was rejected (e.g. its site was deleted since the request); bulk_ingest is all-or-nothing,
+        # so insert the rows one by one and drop only the rejected ones
+        return _insert_individually(fields)
+    except Exception:
+        # The database couldn't be reached; requeue the batch ahead of newer page views for the next flush
+        with _lock:
+            _pending[:0] = fields
+            overflow = len(_pending) - MAX_PENDING
+            if overflow > 0:
+                del _pending[:overflow]
+        if overflow > 0:
+            logger.error("Page view buffer is full; dropped the %d oldest page views", overflow)
+        raise
+    return len(fields)
+
+
+def _insert_individually(fields):
+    """Insert page views one at a time, logging and skipping any the database rejects."""
+    written = 0
+    for page_view_fields in fields:
+        try:
+            with transaction.atomic():
+                PageView.bulk_ingest([page_view_fields])
+            written += 1
+        except (IntegrityError, DataError) as e:
+            logger.error("Dropping buffered page view rejected by the database: %s", e)
+    return written
+
+
+def _flush_forever():
+    """Flush loop run by the background thread."""
+    while True:
+        _flush_requested.wait(FLUSH_INTERVAL)
+        _flush_requested.clear()
+
+        # This thread never sees request_started/finished, so expire stale connections here
+        close_old_connections()
+        try:
+            flush()
+        except Exception as e:
+            logger.error("Failed to write buffered page views: %s", e, exc_info=True)
@@ -0,0 +1,101 @@
+"""
+Shared Redis connection, RQ queues and enqueue helper for background aggregation jobs.
+
+The connection is created on first use and shared by every caller in the process, instead of each
+management command module opening its own connection pool at import time.
+"""
+
+import os
+from functools import cache
+
+from opentelemetry import trace
+
+from server.tasks import run_daily_aggregation, run_hourly_aggregation
+
+try:
+    import redis  # type: ignore
+    from rq import Queue  # type: ignore
+except Exception:  # pragma: no cover
+    redis = None
+    Queue = None  # type: ignore
+
+AGGREGATIONS_QUEUE = "aggregations"
+
+# Task run for each kind of aggregation
+AGGREGATION_TASKS = {
+    "daily": run_daily_aggregation,
+    "hourly": run_hourly_aggregation,
+}
+
+
+def get_connection(redis_url: str | None = None):
+    """
+    Get the process-wide Redis connection for a URL, backed by a keepalive connection pool.
+
+    Args:
+        redis_url: Redis URL (default: from REDIS_URL env var)
+
+    Returns:
+        redis.Redis, or None if redis/rq aren't installed or no URL is configured
+    """
+    redis_url = redis_url or os.getenv("REDIS_URL")
+    if not redis or not Queue or not redis_url:
+        return None
+    return _connect(redis_url)
+
+
+@cache
+def _connect(redis_url: str):
+    """Create the pooled connection for a URL; cached so each URL gets one pool per process."""
+    pool = redis.ConnectionPool.from_url(redis_url, socket_keepalive=True)
+    return redis.Redis(connection_pool=pool)
+
+
+@cache
+def get_queue(name: str = AGGREGATIONS_QUEUE):
+    """
+    Get the RQ queue with the given name, bound to the shared connection.
+
+    Returns:
+        rq.Queue, or None if Redis isn't available
+    """
+    connection = get_connection()
+    if connection is None:
+        return None
+    return Queue(name, connection=connection)
+
+
+def enqueue_or_run_aggregation(kind: str, ranges):
+    """
+    Enqueue or directly run aggregation jobs, based on RQ availability.
+
+    Enqueued jobs are submitted together in a single Redis pipeline. The task function itself is
+    enqueued, so the worker skips call_command's argument parsing. Each job is recorded as an event
+    on the caller's current span rather than getting a span of its own.
+
+    Args:
+        kind: "daily" or "hourly"
+        ranges: List of (site_identifier, start, end) tuples; dates for daily, datetimes for hourly
+    """
+    task = AGGREGATION_TASKS[kind]
+    span = trace.get_current_span()
+    span.set_attribute("aggregation.jobs_count", len(ranges))
+
+    aggregations_queue = get_queue()
+    span.set_attribute("execution.mode", "direct" if aggregations_queue is None else "enqueued")
+
+    jobs = []
+    for site_identifier, start, end in ranges:
+        start_iso = start.isoformat()
+        end_iso = end.isoformat()
+        span.add_event(
+            f"{kind}_aggregation",
+            {"site.identifier": site_identifier, "aggregation.start": start_iso, "aggregation.end": end_iso},
+        )
+        if aggregations_queue is None:
+            task(site_identifier, start_iso, end_iso)
+        else:
+            jobs.append(aggregations_queue.prepare_data(task, args=(site_identifier, start_iso, end_iso)))
+
+    if jobs:
+        aggregations_queue.enqueue_many(jobs)
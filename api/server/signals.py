@@ -0,0 +1,20 @@
+"""
+Signal handlers for the server app.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Site, site_id_cache_key
+
+
+@receiver(post_delete, sender=Site)
+def invalidate_site_id_cache(sender, instance, **kwargs):
+    """
+    Drop the cached identifier -> id mapping so deleted sites stop accepting page views.
+
+    This only reaches other processes through a shared cache, which is why the mapping is only cached
+    when Redis is configured (see SITE_ID_CACHE_TIMEOUT in settings).
+    """
+    cache.delete(site_id_cache_key(instance.identifier))
@@ -0,0 +1,36 @@
+"""
+Aggregation tasks enqueued on the "aggregations" RQ queue by the queue_* management commands.
+
+Each task runs the matching aggregation command's handler in-process for a single site, without going
+through call_command's argument parsing for every job.
+"""
+
+from server.management.commands import aggregate_daily_stats, aggregate_hourly_stats
+
+
+def run_daily_aggregation(site_identifier: str, start: str, end: str):
+    """
+    Aggregate daily statistics for one site.
+
+    Args:
+        site_identifier: Identifier of the site to aggregate
+        start: ISO8601 start date (UTC), inclusive
+        end: ISO8601 end date (UTC), inclusive
+    """
+    aggregate_daily_stats.Command().handle(
+        site=site_identifier, start=start, end=end, days=30, workers=1, verbose=False
+    )
+
+
+def run_hourly_aggregation(site_identifier: str, start: str, end: str):
+    """
+    Aggregate hourly statistics for one site.
+
+    Args:
+        site_identifier: Identifier of the site to aggregate
+        start: ISO8601 start datetime (UTC)
+        end: ISO8601 end datetime (UTC)
+    """
+    aggregate_hourly_stats.Command().handle(
+        site=site_identifier, start=start, end=end, hours=24, workers=1, verbose=False
+    )
@@ -0,0 +1,202 @@
+"""
+Tests for the page view aggregation commands.
+
+These tests verify that aggregate_hourly_stats and aggregate_daily_stats:
+- Create stats for buckets seen for the first time
+- Skip buckets with no page views newer than the last processed one
+- Recount partially processed buckets and report only the new page views
+- Never report a negative number of processed page views
+- Bucket page views by UTC hour whatever offset --start/--end are given in
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase
+
+from server.models import DailyPageViewStats, HourlyPageViewStats, PageView, Site
+
+HOUR = datetime(2024, 1, 15, 10, tzinfo=UTC)
+DAY = date(2024, 1, 15)
+
+
+class AggregationTestCase(TestCase):
+    """Shared fixtures for the aggregation command tests"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="aggregation-owner", password="pass12345")
+        cls.site = Site.objects.create(name="Aggregation Site", user=user)
+
+    def setUp(self):
+        # The commands configure telemetry on start, which needs Axiom credentials
+        for command in ("aggregate_hourly_stats", "aggregate_daily_stats"):
+            patcher = mock.patch(f"server.management.commands.{command}.configure_telemetry")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create_pageview(self, created_at):
+        """Create a page view for the test site at the given time."""
+        page_view = PageView.objects.create(
+            site=self.site, url="https://example.com/", ip_hash=b"hash", user_agent="test_agent"
+        )
+        # created_at is set by the database, so move the view afterwards
+        PageView.objects.filter(pk=page_view.pk).update(created_at=created_at)
+        return page_view
+
+    def aggregate(self, command, start, end):
+        """Run an aggregation command for the test site over [start, end] and return its output."""
+        stdout = StringIO()
+        call_command(command, start=start, end=end, site=self.site.identifier, workers=1, stdout=stdout)
+        return stdout.getvalue()
+
+
+class AggregateHourlyStatsTests(AggregationTestCase):
+    """Given: Page views aggregated into hourly stats"""
+
+    def aggregate_hour(self):
+        return self.aggregate("aggregate_hourly_stats", "2024-01-15T10:00:00+00:00", "2024-01-15T10:59:59+00:00")
+
+    def test_new_hour_is_created(self):
+        """When: An hour is aggregated for the first time, Then: Its stats count every page view in it"""
+        # Given
+        self.create_pageview(HOUR + timedelta(minutes=5))
+        last = self.create_pageview(HOUR + timedelta(minutes=10))
+
+        # When
+        output = self.aggregate_hour()
+
+        # Then
+        stats = HourlyPageViewStats.objects.get(site=self.site, hour_bucket=HOUR)
+        self.assertEqual(stats.pageview_count, 2)
+        self.assertEqual(stats.last_processed_created_at, HOUR + timedelta(minutes=10))
+        self.assertEqual(stats.last_processed_pageview_id, last.id)
+        self.assertIn("2 pageviews processed", output)
+
+    def test_unchanged_hour_is_skipped(self):
+        """When: An hour has no page views newer than the last processed one, Then: Its stats aren't rewritten"""
+        # Given
+        self.create_pageview(HOUR + timedelta(minutes=5))
+        self.aggregate_hour()
+        HourlyPageViewStats.objects.filter(site=self.site, hour_bucket=HOUR).update(pageview_count=99)
+
+        # When
+        output = self.aggregate_hour()
+
+        # Then
+        self.assertEqual(HourlyPageViewStats.objects.get(site=self.site, hour_bucket=HOUR).pageview_count, 99)
+        self.assertIn("0 updated, 0 pageviews processed", output)
+
+    def test_partially_processed_hour_counts_new_pageviews(self):
+        """When: New page views arrive in an aggregated hour, Then: It is recounted and only they are reported"""
+        # Given
+        self.create_pageview(HOUR + timedelta(minutes=5))
+        self.aggregate_hour()
+        last = self.create_pageview(HOUR + timedelta(minutes=30))
+
+        # When
+        output = self.aggregate_hour()
+
+        # Then
+        stats = HourlyPageViewStats.objects.get(site=self.site, hour_bucket=HOUR)
+        self.assertEqual(stats.pageview_count, 2)
+        self.assertEqual(stats.last_processed_pageview_id, last.id)
+        self.assertIn("1 updated, 1 pageviews processed", output)
+
+    def test_deleted_pageviews_are_not_reported_as_negative(self):
+        """When: The stored count is above the new total, Then: The processed count is 0 rather than negative"""
+        # Given
+        self.create_pageview(HOUR + timedelta(minutes=5))
+        self.aggregate_hour()
+        HourlyPageViewStats.objects.filter(site=self.site, hour_bucket=HOUR).update(pageview_count=5)
+        self.create_pageview(HOUR + timedelta(minutes=30))
+
+        # When
+        output = self.aggregate_hour()
+
+        # Then
+        self.assertEqual(HourlyPageViewStats.objects.get(site=self.site, hour_bucket=HOUR).pageview_count, 2)
+        self.assertIn(" 0 pageviews processed", output)
+
+    def test_start_with_half_hour_offset_uses_utc_buckets(self):
+        """When: --start/--end use a +05:30 offset, Then: Page views land in their UTC hour"""
+        # Given
+        self.create_pageview(HOUR + timedelta(minutes=20))
+
+        # When (10:15 - 11:15 UTC)
+        self.aggregate("aggregate_hourly_stats", "2024-01-15T15:45:00+05:30", "2024-01-15T16:45:00+05:30")
+
+        # Then
+        self.assertEqual(HourlyPageViewStats.objects.get(site=self.site, hour_bucket=HOUR).pageview_count, 1)
+        self.assertFalse(HourlyPageViewStats.objects.filter(site=self.site, hour_bucket__minute=30).exists())
+
+
+class AggregateDailyStatsTests(AggregationTestCase):
+    """Given: Page views aggregated into daily stats"""
+
+    def aggregate_day(self):
+        return self.aggregate("aggregate_daily_stats", DAY.isoformat(), DAY.isoformat())
+
+    def test_new_day_is_created(self):
+        """When: A day is aggregated for the first time, Then: Its stats count every page view in it"""
+        # Given
+        self.create_pageview(HOUR)
+        last = self.create_pageview(HOUR + timedelta(hours=5))
+
+        # When
+        output = self.aggregate_day()
+
+        # Then
+        stats = DailyPageViewStats.objects.get(site=self.site, day_bucket=DAY)
+        self.assertEqual(stats.pageview_count, 2)
+        self.assertEqual(stats.last_processed_created_at, HOUR + timedelta(hours=5))
+        self.assertEqual(stats.last_processed_pageview_id, last.id)
+        self.assertIn("2 pageviews processed", output)
+
+    def test_unchanged_day_is_skipped(self):
+        """When: A day has no page views newer than the last processed one, Then: Its stats aren't rewritten"""
+        # Given
+        self.create_pageview(HOUR)
+        self.aggregate_day()
+        DailyPageViewStats.objects.filter(site=self.site, day_bucket=DAY).update(pageview_count=99)
+
+        # When
+        output = self.aggregate_day()
+
+        # Then
+        self.assertEqual(DailyPageViewStats.objects.get(site=self.site, day_bucket=DAY).pageview_count, 99)
+        self.assertIn("0 updated, 0 pageviews processed", output)
+
+    def test_partially_processed_day_counts_new_pageviews(self):
+        """When: New page views arrive in an aggregated day, Then: It is recounted and only they are reported"""
+        # Given
+        self.create_pageview(HOUR)
+        self.aggregate_day()
+        last = self.create_pageview(HOUR + timedelta(hours=5))
+
+        # When
+        output = self.aggregate_day()
+
+        # Then
+        stats = DailyPageViewStats.objects.get(site=self.site, day_bucket=DAY)
+        self.assertEqual(stats.pageview_count, 2)
+        self.assertEqual(stats.last_processed_pageview_id, last.id)
+        self.assertIn("1 updated, 1 pageviews processed", output)
+
+    def test_deleted_pageviews_are_not_reported_as_negative(self):
+        """When: The stored count is above the new total, Then: The processed count is 0 rather than negative"""
+        # Given
+        self.create_pageview(HOUR)
+        self.aggregate_day()
+        DailyPageViewStats.objects.filter(site=self.site, day_bucket=DAY).update(pageview_count=5)
+        self.create_pageview(HOUR + timedelta(hours=5))
+
+        # When
+        output = self.aggregate_day()
+
+        # Then
+        self.assertEqual(DailyPageViewStats.objects.get(site=self.site, day_bucket=DAY).pageview_count, 2)
+        self.assertIn(" 0 pageviews processed", output)
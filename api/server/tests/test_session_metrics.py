@@ -0,0 +1,142 @@
+"""
+Tests for session metric recalculation.
+
+These tests verify that Session.update_metrics and Session.bulk_update_metrics:
+- Count page views and mark bounces
+- Set duration and exit page for multi-view sessions
+- Leave duration and exit page alone for single-view sessions
+- Leave sessions without page views untouched
+"""
+
+from datetime import timedelta
+
+from django.contrib.auth.models import User
+from django.test import TestCase
+from django.utils import timezone
+
+from server.models import PageView, Session, Site
+
+
+class SessionMetricsTestCase(TestCase):
+    """Shared fixtures for the session metric tests"""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(username="metrics-owner", password="pass12345")
+        cls.site = Site.objects.create(name="Metrics Site", user=user)
+
+    def create_session(self, session_id, paths, **fields):
+        """Create a session with one page view per path, one minute apart."""
+        session = Session.objects.create(site=self.site, session_id=session_id, enter_page="/", **fields)
+        start = timezone.now()
+        for minutes, path in enumerate(paths):
+            page_view = PageView.objects.create(
+                site=self.site,
+                session=session,
+                url=f"https://example.com{path}",
+                ip_hash=b"hash",
+                user_agent="test_agent",
+            )
+            # created_at is set by the database, so space the views out afterwards
+            PageView.objects.filter(pk=page_view.pk).update(created_at=start + timedelta(minutes=minutes))
+        return session
+
+
+class UpdateMetricsTests(SessionMetricsTestCase):
+    """Given: A single session is recalculated with update_metrics()"""
+
+    def test_multi_view_session_gets_duration_and_exit_page(self):
+        """When: The session has several page views, Then: Its count, duration and exit page are updated"""
+        # Given
+        session = self.create_session(b"m" * 32, ["/", "/pricing", "/signup"])
+
+        # When
+        session.update_metrics()
+
+        # Then
+        session.refresh_from_db()
+        self.assertEqual(session.page_view_count, 3)
+        self.assertFalse(session.is_bounce)
+        self.assertEqual(session.duration, 120)
+        self.assertEqual(session.exit_page, "/signup")
+
+    def test_single_view_session_keeps_duration_and_exit_page(self):
+        """When: The session has one page view, Then: Only its count and bounce flag change"""
+        # Given
+        session = self.create_session(b"s" * 32, ["/"], duration=42, exit_page="/kept")
+
+        # When
+        session.update_metrics()
+
+        # Then
+        session.refresh_from_db()
+        self.assertEqual(session.page_view_count, 1)
+        self.assertTrue(session.is_bounce)
+        self.assertEqual(session.duration, 42)
+        self.assertEqual(session.exit_page, "/kept")
+
+    def test_session_without_page_views_is_untouched(self):
+        """When: The session has no page views, Then: None of its metrics change"""
+        # Given
+        session = self.create_session(b"e" * 32, [], page_view_count=5, duration=42, exit_page="/kept")
+        updated_at = session.updated_at
+
+        # When
+        session.update_metrics()
+
+        # Then
+        session.refresh_from_db()
+        self.assertEqual(session.page_view_count, 5)
+        self.assertEqual(session.duration, 42)
+        self.assertEqual(session.exit_page, "/kept")
+        self.assertEqual(session.updated_at, updated_at)
+
+
+class BulkUpdateMetricsTests(SessionMetricsTestCase):
+    """Given: Sessions are recalculated with bulk_update_metrics()"""
+
+    def test_multi_view_session_gets_duration_and_exit_page(self):
+        """When: A session has several page views, Then: Its count, duration and exit page are updated"""
+        # Given
+        session = self.create_session(b"m" * 32, ["/", "/pricing", "/signup"])
+
+        # When
+        updated = Session.bulk_update_metrics([session.id])
+
+        # Then
+        session.refresh_from_db()
+        self.assertEqual(updated, 1)
+        self.assertEqual(session.page_view_count, 3)
+        self.assertFalse(session.is_bounce)
+        self.assertEqual(session.duration, 120)
+        self.assertEqual(session.exit_page, "/signup")
+
+    def test_single_view_session_keeps_duration_and_exit_page(self):
+        """When: A session has one page view, Then: Only its count and bounce flag are written"""
+        # Given
+        session = self.create_session(b"s" * 32, ["/"], duration=42, exit_page="/kept")
+
+        # When
+        Session.bulk_update_metrics([session.id])
+
+        # Then
+        session.refresh_from_db()
+        self.assertEqual(session.page_view_count, 1)
+        self.assertTrue(session.is_bounce)
+        self.assertEqual(session.duration, 42)
+        self.assertEqual(session.exit_page, "/kept")
+
+    def test_session_without_page_views_is_untouched(self):
+        """When: A session has no page views, Then: It isn't counted or written"""
+        # Given
+        session = self.create_session(b"e" * 32, [], page_view_count=5, duration=42, exit_page="/kept")
+
+        # When
+        updated = Session.bulk_update_metrics([session.id])
+
+        # Then
+        session.refresh_from_db()
+        self.assertEqual(updated, 0)
+        self.assertEqual(session.page_view_count, 5)
+        self.assertEqual(session.duration, 42)
+        self.assertEqual(session.exit_page, "/kept")
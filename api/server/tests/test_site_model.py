@@ -8,9 +8,12 @@ These tests verify the behavior of the Site model including:
 - Page view count integration
 """
 
+from unittest import mock
+
+from django.contrib.auth.models import User
 from django.test import TestCase
 
-from server.models import PageView, Site
+from server.models import IDENTIFIER_ADJECTIVES, IDENTIFIER_NOUNS, PageView, Site
 from server.serializers import SiteSerializer
 
 
@@ -101,6 +104,72 @@ class SiteIdentifierGenerationTests(TestCase):
             self.assertEqual(len(hash_part), 6)
             self.assertTrue(all(c.isupper() or c.isdigit() for c in hash_part))
 
+    def test_generate_identifiers_matches_single_format(self):
+        """When: Identifiers are generated in bulk, Then: Each has the adjective-noun-XXXXXX format"""
+        # When
+        identifiers = Site.generate_identifiers(50)
+
+        # Then
+        self.assertEqual(len(identifiers), 50)
+        for identifier in identifiers:
+            adjective, noun, hash_part = identifier.split("-")
+            self.assertIn(adjective, IDENTIFIER_ADJECTIVES)
+            self.assertIn(noun, IDENTIFIER_NOUNS)
+            self.assertRegex(hash_part, r"^[0-9A-F]{6}$")
+
+    def test_identifier_collision_is_retried(self):
+        """When: A generated identifier is already taken, Then: A new one is generated and the site is saved"""
+        # Given
+        user = User.objects.create_user(username="collision-owner", password="pass12345")
+        existing = Site.objects.create(name="Existing Site", user=user)
+
+        # When
+        with mock.patch.object(
+            Site, "generate_identifier", side_effect=[existing.identifier, "mossy-acorn-ABC123"]
+        ) as generate:
+            site = Site.objects.create(name="New Site", user=user)
+
+        # Then
+        self.assertEqual(generate.call_count, 2)
+        self.assertEqual(site.identifier, "mossy-acorn-ABC123")
+        self.assertTrue(Site.objects.filter(pk=site.pk).exists())
+
+    def test_bulk_generate_identifiers_skips_used_identifiers(self):
+        """When: Identifiers are bulk generated, Then: None repeat or collide with existing sites"""
+        # Given
+        user = User.objects.create_user(username="bulk-owner", password="pass12345")
+        existing = Site.objects.create(name="Existing Site", user=user)
+
+        # When
+        with mock.patch.object(
+            Site,
+            "generate_identifiers",
+            side_effect=[[existing.identifier, "mossy-acorn-AAAAAA"], ["mossy-acorn-AAAAAA"], ["mossy-acorn-BBBBBB"]],
+        ):
+            identifiers = Site.bulk_generate_identifiers(2)
+
+        # Then
+        self.assertEqual(identifiers, ["mossy-acorn-AAAAAA", "mossy-acorn-BBBBBB"])
+
+    def test_bulk_create_with_identifiers_assigns_missing_identifiers(self):
+        """When: Sites are bulk created, Then: Sites without an identifier get a unique one and keep theirs otherwise"""
+        # Given
+        user = User.objects.create_user(username="bulk-create-owner", password="pass12345")
+        sites = [
+            Site(name="Seeded Site", user=user, identifier="mossy-acorn-SEEDED"),
+            Site(name="New Site 1", user=user),
+            Site(name="New Site 2", user=user),
+        ]
+
+        # When
+        Site.bulk_create_with_identifiers(sites)
+
+        # Then
+        identifiers = list(Site.objects.filter(user=user).values_list("identifier", flat=True))
+        self.assertEqual(len(identifiers), 3)
+        self.assertEqual(len(set(identifiers)), 3)
+        self.assertIn("mossy-acorn-SEEDED", identifiers)
+
 
 class SiteSerializerTests(TestCase):
     """Given: The Site serializer with page view counts"""
@@ -116,12 +185,12 @@ class SiteSerializerTests(TestCase):
                 url=f"https://example.com/page{i}",
                 path=f"/page{i}",
                 referrer="",
-                ip_hash=f"hash_{i}",
+                ip_hash=f"hash_{i}".encode(),
                 user_agent="test_agent",
                 browser="Chrome",
                 browser_version="120.0",
                 operating_system="Linux",
-                device_type="desktop",
+                device_type=PageView.DeviceType.DESKTOP,
             )
 
     def test_serializer_includes_pageview_count(self):
@@ -67,7 +67,7 @@ class UserAgentParsingTests(TestCase):
             page_view = PageView.objects.latest("created_at")
             self.assertEqual(page_view.browser, test_case["expected_browser"])
             self.assertEqual(page_view.operating_system, test_case["expected_os"])
-            self.assertEqual(page_view.device_type, test_case["expected_device"])
+            self.assertEqual(page_view.device_type_name, test_case["expected_device"])
 
     def test_mobile_device_detection(self):
         """When: Mobile user agent is used, Then: It detects mobile device"""
@@ -110,7 +110,7 @@ class UserAgentParsingTests(TestCase):
             # Then
             pv = PageView.objects.filter(path=f"/mobile-{test_case['expected_os']}").first()
             self.assertIsNotNone(pv)
-            self.assertEqual(pv.device_type, test_case["expected_device"])
+            self.assertEqual(pv.device_type_name, test_case["expected_device"])
             self.assertIn(test_case["expected_browser"], pv.browser)
             self.assertEqual(pv.operating_system, test_case["expected_os"])
 
@@ -136,7 +136,7 @@ class UserAgentParsingTests(TestCase):
 
         # Then
         page_view = PageView.objects.latest("created_at")
-        self.assertEqual(page_view.device_type, "tablet")
+        self.assertEqual(page_view.device_type, PageView.DeviceType.TABLET)
         self.assertEqual(page_view.operating_system, "iOS")
 
     def test_bot_detection(self):
@@ -162,5 +162,5 @@ class UserAgentParsingTests(TestCase):
             )
 
         # Then
-        bot_views = PageView.objects.filter(site=self.site, device_type="bot", path="/bot-test")
+        bot_views = PageView.objects.filter(site=self.site, device_type=PageView.DeviceType.BOT, path="/bot-test")
         self.assertEqual(bot_views.count(), 4)
@@ -54,7 +54,7 @@ def send_mailpace_email(to_email, subject, text_body, html_body=None):
         "MailPace-Server-Token": settings.MAILPACE_API_KEY,
     }
 
-    logger.debug(f"Sending email to {to_email} via MailPace API")
+    logger.debug("Sending email to %s via MailPace API", to_email)
 
     response = requests.post(settings.MAILPACE_API_URL, json=payload, headers=headers, timeout=30)
 
@@ -104,7 +104,7 @@ def signup_view(request):
         from django.utils import timezone
 
         user.last_login = timezone.now()
-        user.save()
+        user.save(update_fields=["last_login"])
 
         # Log the user in
         login(request, user)
@@ -122,7 +122,7 @@ def signup_view(request):
         )
 
     except Exception as e:
-        logger.error(f"Signup error: {e}")
+        logger.error("Signup error: %s", e)
         return Response(
             {"error": "Registration failed"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -174,7 +174,7 @@ def login_view(request):
             )
 
     except Exception as e:
-        logger.error(f"Login error: {e}")
+        logger.error("Login error: %s", e)
         return Response(
             {"error": "Login failed"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -193,7 +193,7 @@ def logout_view(request):
             status=status.HTTP_200_OK,
         )
     except Exception as e:
-        logger.error(f"Logout error: {e}")
+        logger.error("Logout error: %s", e)
         return Response(
             {"error": "Logout failed"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -276,7 +276,7 @@ The Squirrel Stats Team"""
         )
 
     except Exception as e:
-        logger.error(f"Password reset error: {e}")
+        logger.error("Password reset error: %s", e)
         return Response(
             {"error": "Password reset failed"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -326,7 +326,7 @@ def reset_password_view(request):
 
         # Set new password
         user.set_password(new_password)
-        user.save()
+        user.save(update_fields=["password"])
 
         return Response(
             {"message": "Password reset successful"},
@@ -334,7 +334,7 @@ def reset_password_view(request):
         )
 
     except Exception as e:
-        logger.error(f"Password reset confirmation error: {e}")
+        logger.error("Password reset confirmation error: %s", e)
         return Response(
             {"error": "Password reset failed"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -364,7 +364,7 @@ def user_info_view(request):
                 status=status.HTTP_401_UNAUTHORIZED,
             )
     except Exception as e:
-        logger.error(f"User info error: {e}")
+        logger.error("User info error: %s", e)
         return Response(
             {"error": "Failed to get user info"},
             status=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -98,7 +98,7 @@ def chart_data(request):
 
         # Get the site and verify ownership
         try:
-            site = Site.objects.get(id=site_id, user=request.user)
+            site = Site.objects.only("id").get(id=site_id, user=request.user)
         except Site.DoesNotExist:
             return Response({"error": "Site not found or access denied"}, status=404)
 
@@ -146,7 +146,7 @@ def chart_data(request):
         return Response(response_data)
 
     except Exception as e:
-        logger.error(f"Error in chart_data: {e}", exc_info=True)
+        logger.error("Error in chart_data: %s", e, exc_info=True)
         return Response({"error": "Internal server error"}, status=500)
 
 
@@ -224,11 +224,15 @@ def _get_hourly_data(
         List of hourly data dictionaries
     """
     # Query hourly stats
-    hourly_stats = HourlyPageViewStats.objects.filter(
-        site=site,
-        hour_bucket__gte=start_time,
-        hour_bucket__lt=end_time,
-    ).order_by("hour_bucket")
+    hourly_stats = (
+        HourlyPageViewStats.objects.filter(
+            site=site,
+            hour_bucket__gte=start_time,
+            hour_bucket__lt=end_time,
+        )
+        .only("hour_bucket", "pageview_count", "unique_session_count")
+        .order_by("hour_bucket")
+    )
 
     # Create a mapping of hour buckets to stats
     stats_by_hour = {stats.hour_bucket: stats for stats in hourly_stats}
@@ -322,11 +326,15 @@ def _get_daily_data(
         List of daily data dictionaries
     """
     # Query daily stats
-    daily_stats = DailyPageViewStats.objects.filter(
-        site=site,
-        day_bucket__gte=start_date,
-        day_bucket__lte=end_date,
-    ).order_by("day_bucket")
+    daily_stats = (
+        DailyPageViewStats.objects.filter(
+            site=site,
+            day_bucket__gte=start_date,
+            day_bucket__lte=end_date,
+        )
+        .only("day_bucket", "pageview_count", "unique_session_count")
+        .order_by("day_bucket")
+    )
 
     # Create a mapping of day buckets to stats
     stats_by_day = {stats.day_bucket: stats for stats in daily_stats}
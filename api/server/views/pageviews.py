@@ -2,22 +2,48 @@ import hashlib
 import json
 import logging
 
+from django.conf import settings
+from django.core.cache import cache
 from django.http import JsonResponse
+from django.utils import timezone
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_http_methods
 from user_agents import parse
 
 from otel_config import get_tracer
 
-from ..models import PageView, Site
+from .. import pageview_buffer
+from ..models import PageView, Site, site_id_cache_key, split_netloc_and_path
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer()
+
+# Referrers longer than this keep only their domain
+REFERRER_MAX_LENGTH = 2048
+
+
+def get_site_id(site_identifier):
+    """
+    Resolve a site identifier to the site's primary key.
+    Cached (when SITE_ID_CACHE_TIMEOUT is set) because every tracked page view needs it;
+    raises Site.DoesNotExist if unknown.
+    """
+    site_ids = Site.objects.values_list("id", flat=True)
+    if not settings.SITE_ID_CACHE_TIMEOUT:
+        return site_ids.get(identifier=site_identifier)
+
+    cache_key = site_id_cache_key(site_identifier)
+    site_id = cache.get(cache_key)
+    if site_id is None:
+        site_id = site_ids.get(identifier=site_identifier)
+        cache.set(cache_key, site_id, settings.SITE_ID_CACHE_TIMEOUT)
+    return site_id
 
 
 def get_client_ip(request):
     """Get the client's IP address from the request."""
     x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
-    ip = x_forwarded_for.split(",")[0].strip() if x_forwarded_for else request.META.get("REMOTE_ADDR", "")
+    ip = x_forwarded_for.partition(",")[0].strip() if x_forwarded_for else request.META.get("REMOTE_ADDR", "")
     return ip
 
 
@@ -48,7 +74,7 @@ def parse_user_agent(user_agent_string):
             "os": user_agent.os.family or "Unknown",
         }
     except Exception as e:
-        logger.warning(f"Failed to parse user agent: {e}. User agent: {user_agent_string}")
+        logger.warning("Failed to parse user agent: %s. User agent: %s", e, user_agent_string)
         return {
             "device_type": "unknown",
             "browser": "Unknown",
@@ -72,7 +98,6 @@ def track_pageview(request):
 
     Returns a JSON response.
     """
-    tracer = get_tracer()
     with tracer.start_as_current_span("track_pageview") as span:
         try:
             # Extract parameters
@@ -103,7 +128,7 @@ def track_pageview(request):
 
             # Find the site
             try:
-                site = Site.objects.get(identifier=site_identifier)
+                site_id = get_site_id(site_identifier)
                 span.set_attribute("pageview.site_found", True)
             except Site.DoesNotExist:
                 span.set_attribute("pageview.site_found", False)
@@ -120,16 +145,21 @@ def track_pageview(request):
                         qs_params = "&".join([f"{k}={v}" for k, v in qs_data.items()])
                         url += "?" + qs_params
                 except json.JSONDecodeError as e:
-                    logger.warning(f"Failed to parse query string JSON: {e}. Raw qs: {query_string}")
+                    logger.warning("Failed to parse query string JSON: %s. Raw qs: %s", e, query_string)
                 except Exception as e:
-                    logger.warning(f"Unexpected error parsing query string: {e}")
+                    logger.warning("Unexpected error parsing query string: %s", e)
 
             # Get client information
             ip_address = get_client_ip(request)
             user_agent = request.META.get("HTTP_USER_AGENT", "")
 
+            # Parse the referrer domain here so PageView.save() doesn't have to
+            referrer_domain = split_netloc_and_path(referrer)[0] if referrer else ""
+            if len(referrer) > REFERRER_MAX_LENGTH:
+                referrer = ""
+
             # Hash the IP address for privacy
-            ip_hash = hashlib.sha256(ip_address.encode()).hexdigest()
+            ip_hash = hashlib.blake2b(ip_address.encode(), digest_size=16, usedforsecurity=False).digest()
 
             # Parse user agent for basic device info
             device_info = parse_user_agent(user_agent)
@@ -139,19 +169,26 @@ def track_pageview(request):
             span.set_attribute("pageview.browser", device_info.get("browser", ""))
             span.set_attribute("pageview.os", device_info.get("os", ""))
 
-            # Create the page view
-            PageView.objects.create(
-                site=site,
-                url=url,
-                path=path,
-                referrer=referrer,
-                ip_hash=ip_hash,
-                user_agent=user_agent,
-                browser=device_info.get("browser", ""),
-                browser_version=device_info.get("browser_version", ""),
-                operating_system=device_info.get("os", ""),
-                device_type=device_info.get("device_type", "unknown"),
-            )
+            # Create the page view, or queue it for a batched insert when write buffering is enabled
+            page_view = {
+                "site_id": site_id,
+                "url": url,
+                "path": path,
+                "referrer": referrer,
+                "referrer_domain": referrer_domain,
+                "ip_hash": ip_hash,
+                "user_agent": user_agent,
+                "browser": device_info.get("browser", ""),
+                "browser_version": device_info.get("browser_version", ""),
+                "operating_system": device_info.get("os", ""),
+                "device_type": PageView.DeviceType[device_info.get("device_type", "unknown").upper()],
+            }
+            if pageview_buffer.is_enabled():
+                # Stamp the arrival time now; the database default would record when the batch is written
+                page_view["created_at"] = timezone.now()
+                pageview_buffer.add(page_view)
+            else:
+                PageView.objects.create(**page_view)
 
             span.set_attribute("pageview.created", True)
             # Always return JSON response
@@ -160,5 +197,5 @@ def track_pageview(request):
         except Exception as e:
             span.set_attribute("pageview.error", "internal_error")
             span.set_attribute("pageview.error_message", str(e))
-            logger.error(f"Error tracking page view: {e}", exc_info=True)
+            logger.error("Error tracking page view: %s", e, exc_info=True)
             return JsonResponse({"error": "Internal error"}, status=500)